@@ -10,6 +10,25 @@ let monitoringState = {
   profitableLoads: 0
 };
 
+// Очередь записи recentLoads: чтение-изменение-запись выполняются строго
+// по одной, иначе параллельные LOAD_FOUND затирают грузы друг друга.
+// Грузы, накопившиеся за время текущей записи, сохраняются одной пачкой
+let pendingRecentLoads = [];
+let recentLoadsFlush = null;
+
+// Счетчик для запасных ID грузов: грузы одного скана имеют общий foundAt,
+// поэтому одного времени для уникальности ID недостаточно
+let fallbackLoadIdCounter = 0;
+
+// Очередь записи статистики по тому же принципу: UPDATE_STATISTICS приходит
+// после каждого скана каждой вкладки, и параллельные записи теряли приращения.
+// Накопленные за время записи приращения применяются одним get/set
+let pendingStatistics = [];
+let statisticsFlush = null;
+
+// Сообщения, которые должны приходить из content script (с ID вкладки)
+const MESSAGES_REQUIRING_TAB = new Set(['LOGIN_DETECTED', 'LOGOUT_DETECTED', 'LOAD_FOUND', 'UPDATE_STATISTICS']);
+
 // Настройки по умолчанию
 const DEFAULT_SETTINGS = {
   minRatePerMile: 2.50,
@@ -147,8 +166,7 @@ chrome.runtime.onMessage.addListener(async (message, sender, sendResponse) => {
                       isFromExtensionPage ? 'extension page' : 'unknown';
     
     // Валидация отправителя для сообщений, требующих tab ID
-    const messagesRequiringTab = ['LOGIN_DETECTED', 'LOGOUT_DETECTED', 'LOAD_FOUND', 'UPDATE_STATISTICS'];
-    if (messagesRequiringTab.includes(message.type) && !isFromContentScript) {
+    if (MESSAGES_REQUIRING_TAB.has(message.type) && !isFromContentScript) {
       console.warn(`Message ${message.type} received without valid tab information`);
     }
     
@@ -363,11 +381,13 @@ async function handleLoadFound(loadData) {
     if (loadData.isProfitable) {
       // Сохраняем только прибыльные грузы в список последних найденных
       try {
-        await saveRecentLoad(loadData);
+        // Сохранение и чтение настроек независимы — выполняем параллельно
+        const [, settings] = await Promise.all([
+          saveRecentLoad(loadData),
+          getSettings()
+        ]);
         monitoringState.profitableLoads++;
         
-        const settings = await getSettings();
-        
         // Отправляем уведомление
         if (settings.notificationFrequency !== 'none' && 
             (settings.notificationFrequency === 'all' || loadData.priority === 'HIGH')) {
@@ -542,20 +562,41 @@ async function getSettings() {
   }
 }
 
-// Обновление статистики
-async function updateStatistics(data) {
+// Обновление статистики (через очередь записи)
+function updateStatistics(data) {
+  pendingStatistics.push(data);
+  if (!statisticsFlush) {
+    statisticsFlush = flushStatistics();
+  }
+  return statisticsFlush;
+}
+
+// Запись накопленных приращений статистики, пока очередь не опустеет
+async function flushStatistics() {
+  while (pendingStatistics.length > 0) {
+    const batch = pendingStatistics.splice(0);
+    await writeStatistics(batch);
+  }
+  // Сбрасываем синхронно после проверки очереди (см. flushRecentLoads)
+  statisticsFlush = null;
+}
+
+// Применение пачки приращений статистики (вызывается только из flushStatistics)
+async function writeStatistics(batch) {
   try {
     const result = await chrome.storage.sync.get('statistics');
     const stats = result.statistics || {};
     
     // Инкрементальное обновление
-    Object.keys(data).forEach(key => {
-      if (typeof data[key] === 'number' && key !== 'lastActive') {
-        stats[key] = (stats[key] || 0) + data[key];
-      } else {
-        stats[key] = data[key];
-      }
-    });
+    for (const data of batch) {
+      Object.keys(data).forEach(key => {
+        if (typeof data[key] === 'number' && key !== 'lastActive') {
+          stats[key] = (stats[key] || 0) + data[key];
+        } else {
+          stats[key] = data[key];
+        }
+      });
+    }
     
     await chrome.storage.sync.set({ statistics: stats });
   } catch (error) {
@@ -642,54 +683,79 @@ setInterval(async () => {
   }
 }, 30000); // Проверяем каждые 30 секунд
 
-// Сохранение найденного груза в список последних
-async function saveRecentLoad(loadData) {
+// Сохранение найденного груза в список последних (через очередь записи)
+function saveRecentLoad(loadData) {
+  pendingRecentLoads.push(loadData);
+  if (!recentLoadsFlush) {
+    recentLoadsFlush = flushRecentLoads();
+  }
+  return recentLoadsFlush;
+}
+
+// Запись накопленных грузов пачками, пока очередь не опустеет
+async function flushRecentLoads() {
+  while (pendingRecentLoads.length > 0) {
+    const batch = pendingRecentLoads.splice(0);
+    await writeRecentLoads(batch);
+  }
+  // Сбрасываем синхронно после проверки очереди, чтобы новый груз
+  // не остался в очереди без запущенной записи
+  recentLoadsFlush = null;
+}
+
+// Запись пачки грузов в список последних (вызывается только из flushRecentLoads)
+async function writeRecentLoads(batch) {
   try {
     // Получаем существующий список
     const result = await chrome.storage.local.get('recentLoads');
     let recentLoads = result.recentLoads || [];
     
-    // Создаем новый груз с уникальным ID
-    let loadId = loadData.id;
-    
-    // Фильтруем некорректные ID
-    if (loadId && (
-      loadId.toLowerCase().includes('dlefield') ||
-      loadId.toLowerCase().includes('field') ||
-      loadId.toLowerCase().includes('placeholder') ||
-      loadId.length < 3 ||
-      loadId.length > 50
-    )) {
-      loadId = null;
-    }
-    
-    const newLoad = {
-      ...loadData,
-      foundAt: Date.now(),
-      id: loadId || `load-${Date.now()}`
-    };
-    
-    // Проверяем на дубликаты (по ID и основным параметрам)
-    const isDuplicate = recentLoads.some(existingLoad => {
-      // Проверяем точное совпадение ID
-      if (existingLoad.id === newLoad.id) return true;
+    for (const loadData of batch) {
+      // Создаем новый груз с уникальным ID
+      let loadId = loadData.id;
       
-      // Проверяем совпадение основных параметров (маршрут, мили, ставка)
-      return existingLoad.pickup === newLoad.pickup &&
-             existingLoad.delivery === newLoad.delivery &&
-             existingLoad.miles === newLoad.miles &&
-             existingLoad.ratePerMile === newLoad.ratePerMile &&
-             Math.abs(existingLoad.foundAt - newLoad.foundAt) < 60000; // в течение 1 минуты
-    });
-    
-    if (isDuplicate) {
-      console.log('Duplicate load detected, skipping save:', newLoad.id);
-      return;
+      // Фильтруем некорректные ID
+      if (loadId && (
+        loadId.toLowerCase().includes('dlefield') ||
+        loadId.toLowerCase().includes('field') ||
+        loadId.toLowerCase().includes('placeholder') ||
+        loadId.length < 3 ||
+        loadId.length > 50
+      )) {
+        loadId = null;
+      }
+      
+      // Все грузы одного скана несут общую отметку foundAt из content script,
+      // собственное время берем только если ее нет
+      const foundAt = loadData.foundAt || Date.now();
+      const newLoad = {
+        ...loadData,
+        foundAt,
+        id: loadId || `load-${foundAt}-${++fallbackLoadIdCounter}`
+      };
+      
+      // Проверяем на дубликаты (по ID и основным параметрам)
+      const isDuplicate = recentLoads.some(existingLoad => {
+        // Проверяем точное совпадение ID
+        if (existingLoad.id === newLoad.id) return true;
+      
+        // Проверяем совпадение основных параметров (маршрут, мили, ставка)
+        return existingLoad.pickup === newLoad.pickup &&
+               existingLoad.delivery === newLoad.delivery &&
+               existingLoad.miles === newLoad.miles &&
+               existingLoad.ratePerMile === newLoad.ratePerMile &&
+               Math.abs(existingLoad.foundAt - newLoad.foundAt) < 60000; // в течение 1 минуты
+      });
+      
+      if (isDuplicate) {
+        console.log('Duplicate load detected, skipping save:', newLoad.id);
+        continue;
+      }
+      
+      // Добавляем новый груз в начало списка
+      recentLoads.unshift(newLoad);
     }
     
-    // Добавляем новый груз в начало списка
-    recentLoads.unshift(newLoad);
-    
     // Ограничиваем список 20 элементами
     if (recentLoads.length > 20) {
       recentLoads = recentLoads.slice(0, 20);
@@ -698,7 +764,7 @@ async function saveRecentLoad(loadData) {
     // Сохраняем обновленный список
     await chrome.storage.local.set({ recentLoads });
     
-    console.log(`Saved load to recent list. Total: ${recentLoads.length}`);
+    console.log(`Saved ${batch.length} load(s) to recent list. Total: ${recentLoads.length}`);
   } catch (error) {
     console.error('Error saving recent load:', error);
   }
@@ -111,6 +111,233 @@ const SELECTORS = {
   ]
 };
 
+// Списки SELECTORS служат ключами кешей ниже (JOINED_SELECTORS, HOT_SELECTORS
+// и др.), поэтому замораживаем их: изменение списка сделало бы кеши неверными
+Object.values(SELECTORS).forEach(Object.freeze);
+Object.freeze(SELECTORS);
+
+// Группы SELECTORS, объединенные через запятую, для поиска всех
+// кандидатов группы одним querySelectorAll
+const JOINED_SELECTORS = new Map(
+  Object.values(SELECTORS).map(list => [list, list.join(', ')])
+);
+
+// Объединенный селектор карточек грузов (используется при каждом скане и ожидании)
+const LOAD_ITEMS_QUERY = JOINED_SELECTORS.get(SELECTORS.load_items);
+
+// Те же группы, но с data-testid селекторами в начале списка.
+// Используются, когда карточки на странице размечены data-testid
+const TESTID_FIRST_SELECTORS = new Map(
+  Object.values(SELECTORS).map(list => {
+    const testIds = list.filter(selector => selector.includes('[data-testid='));
+    const rest = list.filter(selector => !selector.includes('[data-testid='));
+    return [list, Object.freeze(testIds.concat(rest))];
+  })
+);
+
+// Признаки груза в тексте узла: одна регулярка вместо цепочки includes/test
+const LOAD_TEXT_INDICATOR_RE = /Origin|Destination|miles|\$\d/;
+
+// Признаки местоположения в тексте карточки (Origin/Destination, "Город, ST", ZIP)
+const LOCATION_TEXT_RE = /Origin|Destination|, |[A-Z]{2}\s*\d{5}/;
+
+// Кеш результатов parseNumberImproved: одинаково оформленные значения
+// ("$1,250", "500 mi") повторяются между карточками и сканированиями
+const PARSED_NUMBER_CACHE = new Map();
+const PARSED_NUMBER_CACHE_LIMIT = 2000;
+
+// Регионы фильтра, собранные в одно регулярное выражение (альтернация
+// без учета регистра). Пересобирается только при смене массива settings.regions
+let regionMatcherCache = { source: null, matcher: null };
+
+// Селектор, сработавший последним для каждой группы SELECTORS. На одном
+// сайте почти всегда выигрывает один и тот же селектор, поэтому его
+// пробуем первым, а полный список — только при промахе
+const HOT_SELECTORS = new Map();
+
+// Ограничение одновременных LOAD_FOUND сообщений: при пачке прибыльных
+// грузов background не получает десятки параллельных запросов к storage
+const MAX_INFLIGHT_LOAD_MESSAGES = 4;
+const loadMessageQueue = { pending: [], inFlight: 0 };
+
+// Кнопки поиска/обновления в порядке приоритета и их объединенный селектор
+const SEARCH_BUTTON_SELECTORS = [
+  'button[type="submit"]',
+  'input[type="submit"]',
+  '[class*="search"][class*="button"]',
+  '[class*="search-btn"]',
+  '[class*="refresh"]',
+  '[class*="reload"]'
+];
+const SEARCH_BUTTON_QUERY = SEARCH_BUTTON_SELECTORS.join(', ');
+
+// Ссылки на страницу поиска грузов в порядке приоритета и их объединенный селектор
+const SEARCH_LINK_SELECTORS = [
+  'a[href*="search"]',
+  'a[href*="loads"]',
+  'a[href*="freight"]',
+  'a[href*="board"]',
+  '[class*="search"] a',
+  '[class*="load"] a',
+  '[class*="freight"] a'
+];
+const SEARCH_LINK_QUERY = SEARCH_LINK_SELECTORS.join(', ');
+
+// Контейнеры результатов поиска в порядке приоритета и их объединенный селектор
+const SEARCH_CONTAINER_SELECTORS = [
+  '.search-results',
+  '[class*="search-result"]',
+  '[class*="result-container"]',
+  '[class*="load-list"]',
+  '[class*="freight-list"]',
+  'main [class*="container"]',
+  '[role="main"]',
+  '#app main',
+  '.content-area'
+];
+const SEARCH_CONTAINER_QUERY = SEARCH_CONTAINER_SELECTORS.join(', ');
+
+// Элементы, по которым страница распознается как Ionic-приложение
+const IONIC_INDICATOR_SELECTOR = 'ion-app, ion-content, ion-grid, ion-row, ion-col, [class*="ionic"]';
+
+// Признаки страницы поиска грузов: части URL и элементы страницы
+const SEARCH_PAGE_PATHS = ['/search', '/loads', '/freight', '/board', '/loadboard'];
+const SEARCH_PAGE_INDICATOR_SELECTOR = [
+  '[class*="search"]',
+  '[class*="load"]',
+  '[class*="freight"]',
+  'input[type="submit"], button[type="submit"]',
+  '[class*="filter"]',
+  '[class*="result"]'
+].join(', ');
+
+// Экспоненциальная пауза между попытками обновления пустой выдачи
+const REFRESH_BACKOFF_BASE = 2000;
+const REFRESH_BACKOFF_MAX = 60000;
+
+// Окно, в течение которого после изменения контента страница считается свежей
+const RECENT_CONTENT_WINDOW = 2000;
+
+// Новый контент сканируется, когда DOM не менялся DOM_SETTLE_DELAY мс,
+// но не позже DOM_SETTLE_MAX_WAIT мс после первого изменения
+const DOM_SETTLE_DELAY = 300;
+const DOM_SETTLE_MAX_WAIT = 2000;
+
+// Путь запросов (fetch/XHR), которыми SPA загружает результаты поиска:
+// целый сегмент /search или /loads, а не любое вхождение подстроки
+// (download, payload, lazyload и т.п.)
+const SEARCH_REQUEST_RE = /\/(?:search|loads)(?:\/|$)/i;
+
+// Селектор кнопки обновления поиска, сработавший в прошлый раз (content
+// script живет в пределах одной страницы FreightPower, поэтому одного
+// значения достаточно). Нужен, когда SPA перерисовало cachedSearchButton
+let lastRefreshSelector = null;
+
+// Последняя нажатая кнопка поиска. Пока она остается в DOM, повторное
+// обновление нажимает ее без поиска по селекторам
+let cachedSearchButton = null;
+
+// Перезагрузка страницы — самый дорогой способ обновить поиск (заново
+// загружаются все ресурсы SPA), поэтому не чаще раза в минуту. Время
+// хранится в sessionStorage, так как состояние скрипта теряется при reload
+const RELOAD_MIN_INTERVAL = 60000;
+const RELOAD_STORAGE_KEY = 'freightMonitorLastReload';
+
+// Текст кнопок поиска (замена невалидных в CSS селекторов :contains).
+// Надпись должна состоять только из этого слова: "Clear Search" или
+// "Saved Searches" сбросили бы критерии поиска пользователя
+const SEARCH_BUTTON_TEXT_RE = /^\s*(?:Search|Поиск|Найти)\s*$/;
+
+// Текст и ID карточки на момент последнего разбора: неизмененную карточку
+// уже известного груза scanForLoads пропускает без разбора полей
+const SCANNED_CARDS = new WeakMap();
+
+// Разумные диапазоны значений для parseNumberImproved
+const NUMBER_RANGES = {
+  rate: { min: 50, max: 1000000 }, // Увеличиваем максимум для обработки центов
+  price: { min: 50, max: 1000000 }, // Увеличиваем максимум для обработки центов
+  miles: { min: 1, max: 5000 },
+  distance: { min: 1, max: 5000 },
+  deadhead: { min: 0, max: 250 }
+};
+
+// Допустимые значения полей карточки LOTHIAN (вне диапазона -> 0)
+const LOTHIAN_LIMITS = {
+  rate: { min: 50, max: 50000 },
+  miles: { min: 1, max: 5000 },
+  deadhead: { min: 0, max: 1000 }
+};
+
+// Признаки груза для эвристического поиска карточек (findLoadElements)
+const HEURISTIC_CITY_RE = /\b[A-Z][a-z]+(?:ville|ton|burg|city|town)\b/;
+const HEURISTIC_STATE_RE = /\b[A-Z]{2}\b/;
+const HEURISTIC_MILES_RE = /\b\d+\s*mi/i;
+const HEURISTIC_DATE_RE = /\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}/i;
+
+// Признаки страницы входа в заголовке (без учета регистра)
+const LOGIN_TITLE_RE = /login|sign in|authenticate|access denied/i;
+
+// Признаки страниц входа в URL
+const LOGIN_PAGE_PATTERNS = ['/login', '/signin', '/auth', '/authenticate', '/sign-in'];
+
+// Ключи localStorage/sessionStorage с токенами авторизации
+const AUTH_STORAGE_KEYS = [
+  'userToken', 'authToken', 'auth', 'accessToken', 'jwt',
+  'session', 'user', 'userData', 'schneider_auth', 
+  'freightpower_auth', 'auth_token', 'bearer_token',
+  'access_token', 'refresh_token', 'authorization'
+];
+
+// Шаблоны имен cookies авторизации
+const AUTH_COOKIE_PATTERNS = [
+  'auth', 'session', 'token', 'jwt', 'bearer',
+  'schneider', 'freightpower', 'user', 'access'
+];
+// Регулярки cookie с непустым значением, скомпилированные один раз
+const AUTH_COOKIE_RES = AUTH_COOKIE_PATTERNS.map(pattern => new RegExp(`${pattern}[^=]*=([^;]+)`));
+
+// Известные типы перевозки и их регулярки (тип ищется даже в слитном тексте)
+const CAPACITY_TYPE_PATTERNS = ['Power Only', 'Dry Van', 'Flatbed', 'Reefer', 'Van']
+  .map(type => [type, new RegExp(type.replace(' ', '\\s*'), 'i')]);
+
+// Элементы интерфейса авторизованного пользователя (сильные индикаторы)
+const STRONG_AUTH_SELECTOR = [
+  '[data-user-authenticated="true"]',
+  '[data-user-id]',
+  '.user-avatar',
+  '.profile-dropdown',
+  '[class*="user-profile"]',
+  '[class*="account-menu"]',
+  '.logout',
+  '[href*="logout"]',
+  '[onclick*="logout"]',
+  '.user-menu',
+  '.header-user'
+].join(', ');
+
+// Элементы форм входа
+const LOGIN_FORM_SELECTOR = [
+  'input[name="password"]',
+  'input[type="password"]',
+  '.login-form',
+  'form[action*="login"]',
+  'form[action*="signin"]',
+  '[class*="signin-form"]',
+  '[class*="login-container"]'
+].join(', ');
+
+// Основные элементы приложения
+const APP_INDICATOR_SELECTOR = [
+  '.search-results',
+  '[class*="search-container"]',
+  '[class*="load-list"]',
+  '[class*="freight-list"]',
+  'main[class*="app"]',
+  '[role="main"]',
+  '#app[class*="authenticated"]',
+  '.content[class*="main"]'
+].join(', ');
+
 // Состояние мониторинга
 let monitoringState = {
   isActive: false,
@@ -126,15 +353,21 @@ let monitoringState = {
   lastScanTime: 0,
   scanCount: 0,
   adaptiveInterval: 3000,
+  usesTestIds: null, // Размечены ли карточки data-testid (определяется один раз на страницу)
   pendingScan: false, // Флаг для отслеживания ожидающих сканирований
   scanTimeout: null, // Таймаут для сканирования
-  watchdogInterval: null // Интервал для watchdog
+  scanIdleCallback: null, // Отложенный до простоя браузера запуск сканирования
+  watchdogInterval: null, // Интервал для watchdog
+  indicatorInterval: null, // Интервал обновления счетчика в индикаторе
+  refreshInFlight: false, // Ожидаем результаты уже запущенного обновления поиска
+  refreshBackoff: 0, // Текущая пауза между попытками обновления поиска (мс)
+  nextRefreshAt: 0, // Раньше этого времени обновление поиска не повторяем
+  lastContentChangeAt: 0, // Когда наблюдатель последний раз видел новый контент грузов
+  domVersion: 0, // Счетчик изменений DOM, замеченных наблюдателем
+  scannedDomVersion: -1, // domVersion, при котором карточки последний раз разбирались
+  settleStartedAt: 0 // Когда началось ожидание стабилизации нового контента
 };
 
-// Инициализация при загрузке
-(function initialize() {
-  console.log('🚀 FreightPower Load Monitor content script загружен');
-
 // Функция для получения корневого элемента карточки
 function getCardRoot(el) {
   if (!el) return null;
@@ -153,6 +386,10 @@ function hasMinimalData(load) {
     (load.miles && load.miles > 0)
   );
 }
+
+// Инициализация при загрузке
+(function initialize() {
+  console.log('🚀 FreightPower Load Monitor content script загружен');
   
   // Определяем и логируем тип сайта
   const siteType = detectSiteType();
@@ -179,9 +416,7 @@ function hasMinimalData(load) {
   observePageChanges();
   
   // Дополнительные слушатели для отслеживания навигации
-  window.addEventListener('popstate', () => {
-    setTimeout(() => checkLoginStatus(true), 1000);
-  });
+  window.addEventListener('popstate', checkLoginAfterNavigation);
   
   // Слушаем изменения в истории (для SPA)
   const originalPushState = history.pushState;
@@ -189,21 +424,29 @@ function hasMinimalData(load) {
   
   history.pushState = function() {
     originalPushState.apply(history, arguments);
-    setTimeout(() => checkLoginStatus(true), 1000);
+    checkLoginAfterNavigation();
   };
   
   history.replaceState = function() {
     originalReplaceState.apply(history, arguments);
-    setTimeout(() => checkLoginStatus(true), 1000);
+    checkLoginAfterNavigation();
   };
   
-  // Попытка автоматического запуска через 3 секунды после загрузки
-  setTimeout(() => {
+  // Попытка автоматического запуска после полной загрузки страницы
+  // (вместо фиксированной паузы в 3 секунды)
+  const tryAutoStart = () => {
+    checkLoginStatus();
     if (monitoringState.isLoggedIn && !monitoringState.isActive) {
       console.log('⚡ Автоматический запуск мониторинга при загрузке...');
       startAutomaticMonitoring();
     }
-  }, 3000);
+  };
+  
+  if (document.readyState === 'complete') {
+    tryAutoStart();
+  } else {
+    window.addEventListener('load', tryAutoStart, { once: true });
+  }
   
   // Глобальные функции для отладки авторизации
   window.freightAuthCheck = function() {
@@ -226,8 +469,7 @@ function detectLogin() {
   const currentUrl = window.location.href.toLowerCase();
   
   // Более точное определение страниц входа
-  const loginPagePatterns = ['/login', '/signin', '/auth', '/authenticate', '/sign-in'];
-  const isOnLoginPage = loginPagePatterns.some(pattern => currentUrl.includes(pattern));
+  const isOnLoginPage = LOGIN_PAGE_PATTERNS.some(pattern => currentUrl.includes(pattern));
   
   if (!isOnFreightPower) {
     return false;
@@ -239,24 +481,12 @@ function detectLogin() {
   }
   
   // Проверяем заголовок страницы на наличие признаков входа
-  const titleIndicatesLogin = document.title.toLowerCase().includes('login') ||
-                             document.title.toLowerCase().includes('sign in') ||
-                             document.title.toLowerCase().includes('authenticate') ||
-                             document.title.toLowerCase().includes('access denied');
-  
-  if (titleIndicatesLogin) {
+  if (LOGIN_TITLE_RE.test(document.title)) {
     return false;
   }
   
   // ПРИОРИТЕТНАЯ ПРОВЕРКА: Storage и cookies (самый надежный способ)
-  const authStorageKeys = [
-    'userToken', 'authToken', 'auth', 'accessToken', 'jwt',
-    'session', 'user', 'userData', 'schneider_auth', 
-    'freightpower_auth', 'auth_token', 'bearer_token',
-    'access_token', 'refresh_token', 'authorization'
-  ];
-  
-  const hasAuthStorage = authStorageKeys.some(key => {
+  const hasAuthStorage = AUTH_STORAGE_KEYS.some(key => {
     const localValue = localStorage.getItem(key);
     const sessionValue = sessionStorage.getItem(key);
     return (localValue && localValue !== 'null' && localValue !== 'undefined') ||
@@ -264,15 +494,9 @@ function detectLogin() {
   });
   
   // Более точная проверка cookies
-  const authCookiePatterns = [
-    'auth', 'session', 'token', 'jwt', 'bearer',
-    'schneider', 'freightpower', 'user', 'access'
-  ];
-  
-  const hasAuthCookie = authCookiePatterns.some(pattern => {
-    const cookies = document.cookie.toLowerCase();
+  const cookies = document.cookie.toLowerCase();
+  const hasAuthCookie = AUTH_COOKIE_RES.some(regex => {
     // Проверяем что cookie не только существует, но и имеет значение
-    const regex = new RegExp(`${pattern}[^=]*=([^;]+)`);
     const match = cookies.match(regex);
     return match && match[1] && match[1].trim() !== '' && match[1] !== 'null';
   });
@@ -283,23 +507,9 @@ function detectLogin() {
     return true;
   }
   
-  // ВТОРИЧНАЯ ПРОВЕРКА: Элементы интерфейса авторизованного пользователя
-  const strongAuthIndicators = [
-    // Сильные индикаторы (специфичные для авторизованных пользователей)
-    document.querySelector('[data-user-authenticated="true"]'),
-    document.querySelector('[data-user-id]'),
-    document.querySelector('.user-avatar'),
-    document.querySelector('.profile-dropdown'),
-    document.querySelector('[class*="user-profile"]'),
-    document.querySelector('[class*="account-menu"]'),
-    document.querySelector('.logout'),
-    document.querySelector('[href*="logout"]'),
-    document.querySelector('[onclick*="logout"]'),
-    document.querySelector('.user-menu'),
-    document.querySelector('.header-user')
-  ];
-  
-  const hasStrongAuthElement = strongAuthIndicators.some(el => el !== null);
+  // ВТОРИЧНАЯ ПРОВЕРКА: Элементы интерфейса авторизованного пользователя.
+  // Каждая группа индикаторов проверяется одним querySelector по списку селекторов
+  const hasStrongAuthElement = document.querySelector(STRONG_AUTH_SELECTOR) !== null;
   
   if (hasStrongAuthElement) {
     console.log('👤 Найдены элементы авторизованного пользователя');
@@ -307,34 +517,13 @@ function detectLogin() {
   }
   
   // ТРЕТИЧНАЯ ПРОВЕРКА: Проверяем отсутствие форм входа
-  const loginFormElements = [
-    document.querySelector('input[name="password"]'),
-    document.querySelector('input[type="password"]'),
-    document.querySelector('.login-form'),
-    document.querySelector('form[action*="login"]'),
-    document.querySelector('form[action*="signin"]'),
-    document.querySelector('[class*="signin-form"]'),
-    document.querySelector('[class*="login-container"]')
-  ];
-  
-  const hasLoginForm = loginFormElements.some(el => el !== null);
+  const hasLoginForm = document.querySelector(LOGIN_FORM_SELECTOR) !== null;
   
   // Проверяем наличие основных элементов приложения
-  const appIndicators = [
-    document.querySelector('.search-results'),
-    document.querySelector('[class*="search-container"]'),
-    document.querySelector('[class*="load-list"]'),
-    document.querySelector('[class*="freight-list"]'),
-    document.querySelector('main[class*="app"]'),
-    document.querySelector('[role="main"]'),
-    document.querySelector('#app[class*="authenticated"]'),
-    document.querySelector('.content[class*="main"]')
-  ];
-  
-  const hasAppElements = appIndicators.some(el => el !== null);
+  const hasAppElements = document.querySelector(APP_INDICATOR_SELECTOR) !== null;
   
   // Финальная логика: если есть элементы приложения и НЕТ форм входа
-  const isLoggedIn = hasAppElements && !hasLoginForm && !titleIndicatesLogin;
+  const isLoggedIn = hasAppElements && !hasLoginForm;
   
   // Детальное логирование для отладки
   console.log('🔍 Расширенная проверка авторизации:', {
@@ -342,7 +531,6 @@ function detectLogin() {
     title: document.title,
     isOnFreightPower,
     isOnLoginPage,
-    titleIndicatesLogin,
     hasAuthStorage,
     hasAuthCookie,
     hasStrongAuthElement,
@@ -538,6 +726,9 @@ function startMonitoring(settings) {
   monitoringState.isActive = true;
   monitoringState.scanCount = 0;
   monitoringState.foundLoads.clear();
+  // Все грузы снова считаются новыми — карточки нужно разобрать заново
+  // (с новыми фильтрами), даже если DOM не менялся
+  monitoringState.scannedDomVersion = -1;
   monitoringState.lastScanTime = Date.now();
   monitoringState.pendingScan = false;
   
@@ -572,6 +763,8 @@ function stopMonitoring() {
     monitoringState.scanTimeout = null;
   }
   
+  cancelScheduledIdleScan();
+  
   if (monitoringState.watchdogInterval) {
     clearInterval(monitoringState.watchdogInterval);
     monitoringState.watchdogInterval = null;
@@ -582,6 +775,14 @@ function stopMonitoring() {
   console.log('Load monitoring stopped');
 }
 
+// Отмена сканирования, уже ожидающего простоя браузера
+function cancelScheduledIdleScan() {
+  if (monitoringState.scanIdleCallback !== null) {
+    cancelIdleCallback(monitoringState.scanIdleCallback);
+    monitoringState.scanIdleCallback = null;
+  }
+}
+
 // Планирование следующего сканирования
 function scheduleNextScan(delay) {
   if (!monitoringState.isActive) return;
@@ -589,12 +790,29 @@ function scheduleNextScan(delay) {
   if (monitoringState.scanTimeout) {
     clearTimeout(monitoringState.scanTimeout);
   }
+  cancelScheduledIdleScan();
   
-  const actualDelay = delay || monitoringState.adaptiveInterval;
+  // delay = 0 означает «сканировать сразу», поэтому подставляем интервал только при отсутствии значения
+  const actualDelay = delay ?? monitoringState.adaptiveInterval;
   
   monitoringState.scanTimeout = setTimeout(() => {
-    if (monitoringState.isActive && monitoringState.isLoggedIn && !monitoringState.pendingScan) {
-      performScan();
+    // Ожидание стабилизации нового контента (если было) завершено
+    monitoringState.settleStartedAt = 0;
+    
+    const runScan = () => {
+      monitoringState.scanIdleCallback = null;
+      if (monitoringState.isActive && monitoringState.isLoggedIn && !monitoringState.pendingScan) {
+        performScan();
+      }
+    };
+    
+    // Сканирование выполняется в основном потоке страницы, поэтому запускаем
+    // его в простое браузера (но не позже чем через секунду), чтобы не
+    // блокировать отрисовку и ввод пользователя
+    if (typeof requestIdleCallback === 'function') {
+      monitoringState.scanIdleCallback = requestIdleCallback(runScan, { timeout: 1000 });
+    } else {
+      runScan();
     }
   }, actualDelay);
 }
@@ -608,21 +826,14 @@ function performScan() {
   monitoringState.pendingScan = true;
   monitoringState.lastScanTime = Date.now();
   
-  // Устанавливаем таймаут для предотвращения зависания
-  const scanTimeout = setTimeout(() => {
-    if (monitoringState.pendingScan) {
-      console.warn('Scan timeout, resetting pending state');
-      monitoringState.pendingScan = false;
-      scheduleNextScan();
-    }
-  }, 30000); // 30 секунд максимум на сканирование
-  
+  // scanForLoads синхронный: таймер защиты от зависания не смог бы
+  // сработать до его завершения, а finally всегда сбрасывает pendingScan.
+  // Зависший мониторинг по-прежнему перезапускает watchdog
   try {
     scanForLoads();
   } catch (error) {
     console.error('Error during scan:', error);
   } finally {
-    clearTimeout(scanTimeout);
     monitoringState.pendingScan = false;
     
     // Планируем следующее сканирование
@@ -682,12 +893,11 @@ function restartMonitoring(newSettings) {
     
     stopMonitoring();
     
-    // Небольшая задержка перед перезапуском
-    setTimeout(() => {
-      if (monitoringState.isLoggedIn) {
-        startMonitoring(settings);
-      }
-    }, 2000);
+    // stopMonitoring синхронно снимает все таймеры, поэтому
+    // перезапускаем сразу, без паузы
+    if (monitoringState.isLoggedIn) {
+      startMonitoring(settings);
+    }
   }
 }
 
@@ -697,6 +907,7 @@ function scanForLoads() {
     return;
   }
   
+  // Время начала скана служит и отметкой foundAt для всех найденных в нем грузов
   const startTime = Date.now();
   monitoringState.scanCount++;
   
@@ -717,15 +928,10 @@ function scanForLoads() {
     const siteType = detectSiteType();
     console.log('Site type:', siteType);
     
-    // Получаем сырые элементы и нормализуем их
-    const rawNodes = Array.from(document.querySelectorAll(SELECTORS.load_items[0]));
-    // На случай если остались другие селекторы — нормализуем:
-    const normalized = rawNodes
-      .map(getCardRoot)
-      .filter(Boolean);
-
-    // Уникализируем по самому элементу
-    const loadElements = Array.from(new Set(normalized));
+    // Получаем все карточки одним запросом. Селекторы load_items указывают
+    // на корень карточки, а querySelectorAll возвращает уникальные элементы,
+    // поэтому отдельная нормализация и дедупликация не нужны
+    const loadElements = Array.from(document.querySelectorAll(LOAD_ITEMS_QUERY));
     
     if (loadElements.length === 0) {
       console.log('❌ Грузы не найдены на странице, пробуем обновить поиск...');
@@ -736,106 +942,122 @@ function scanForLoads() {
     
     console.log(`Found ${loadElements.length} load elements`);
     
+    // Выдача снова не пуста — сбрасываем паузу между обновлениями поиска
+    monitoringState.refreshBackoff = 0;
+    monitoringState.nextRefreshAt = 0;
+    
+    // Один раз на страницу определяем, размечены ли карточки data-testid
+    if (monitoringState.usesTestIds === null) {
+      monitoringState.usesTestIds = !!loadElements[0].querySelector('[data-testid]');
+    }
+    
     let newLoadsFound = 0;
     let profitableLoadsFound = 0;
-    const batchSize = 10; // Обрабатываем по 10 элементов за раз
+    let parseErrors = 0;
     
-    // Обрабатываем элементы батчами для лучшей производительности
-    for (let i = 0; i < loadElements.length; i += batchSize) {
-      const batch = loadElements.slice(i, i + batchSize);
-      
-      batch.forEach((element, batchIndex) => {
-        try {
-          console.log(`🔍 Парсинг элемента ${i + batchIndex + 1}/${loadElements.length}`);
-          const load = parseLoadElement(element);
-          
-          if (!loadData) {
-            console.warn(`⚠️ Элемент ${i + batchIndex + 1} вернул null данные`);
-            return;
+    // Наблюдатель не видел изменений DOM с прошлого разбора — карточки те же,
+    // и их повторный разбор не найдет новых грузов
+    const domUnchanged = monitoringState.domVersion === monitoringState.scannedDomVersion;
+    monitoringState.scannedDomVersion = monitoringState.domVersion;
+    if (domUnchanged) {
+      console.log('⏭️ Выдача не менялась с прошлого скана, разбор карточек пропущен');
+    }
+    const elementsToParse = domUnchanged ? [] : loadElements;
+    
+    // Обрабатываем все карточки за один проход
+    elementsToParse.forEach((element, index) => {
+      try {
+        // Один textContent дешевле разбора всех полей: если текст карточки
+        // не изменился, а ее груз уже учтен, разбор ничего не даст
+        const text = element.textContent;
+        const scanned = SCANNED_CARDS.get(element);
+        if (scanned && scanned.text === text &&
+            (scanned.id === null || monitoringState.foundLoads.has(scanned.id))) {
+          return;
+        }
+        
+        debugLog(`🔍 Парсинг элемента ${index + 1}/${loadElements.length}`);
+        const load = parseLoadElement(element, siteType);
+        SCANNED_CARDS.set(element, { text, id: (load && load.id) || null });
+        
+        // parseLoadElement возвращает null для карточек без осмысленных
+        // данных (hasMinimalData), поэтому повторная проверка здесь не нужна
+        if (!load) {
+          return;
+        }
+        
+        if (!load.id) {
+          // Логируем только если есть достаточно данных для груза
+          if (load.pickup && load.delivery && 
+              load.pickup !== 'Неизвестно' && load.delivery !== 'Неизвестно') {
+            console.log(`🔧 Элемент ${index + 1} без исходного ID, будет сгенерирован автоматически`);
+          } else {
+            console.warn(`⚠️ Элемент ${index + 1} без ID но с частичными данными:`, {
+              pickup: load.pickup,
+              delivery: load.delivery,
+              rate: load.rate,
+              miles: load.miles
+            });
           }
+        }
+        
+        if (load.id && !monitoringState.foundLoads.has(load.id)) {
+          // Новый груз найден
+          monitoringState.foundLoads.set(load.id, {
+            ...load,
+            foundAt: startTime,
+            scanNumber: monitoringState.scanCount
+          });
           
-          // Проверяем минимальную осмысленность данных (базовая проверка перед ID)
-          const hasBasicData = (
-            (loadData.pickup && loadData.pickup !== 'Неизвестно') ||
-            (loadData.delivery && loadData.delivery !== 'Неизвестно') ||
-            (loadData.rate && loadData.rate > 0) ||
-            (loadData.miles && loadData.miles > 0)
-          );
+          newLoadsFound++;
           
-          if (!hasBasicData) {
-            // Молча пропускаем элементы без осмысленных данных
+          // Без ставки или миль груз не может быть прибыльным (ставка за милю
+          // или отношение deadhead выходят за порог), расчет не нужен
+          if (!(load.rate > 0) || !(load.miles > 0)) {
             return;
           }
           
-          if (!load.id) {
-            // Логируем только если есть достаточно данных для груза
-            if (load.pickup && load.delivery && 
-                load.pickup !== 'Неизвестно' && load.delivery !== 'Неизвестно') {
-              console.log(`🔧 Элемент ${i + batchIndex + 1} без исходного ID, будет сгенерирован автоматически`);
-            } else if (hasBasicData) {
-              console.warn(`⚠️ Элемент ${i + batchIndex + 1} без ID но с частичными данными:`, {
-                pickup: load.pickup,
-                delivery: load.delivery,
-                rate: load.rate,
-                miles: load.miles
-              });
-            }
-          }
+          // Рассчитываем прибыльность
+          const profitability = calculateProfitability(load);
           
-          if (load && load.id && !monitoringState.foundLoads.has(load.id)) {
-            // Новый груз найден
-            monitoringState.foundLoads.set(load.id, {
-              ...load,
-              foundAt: Date.now(),
-              scanNumber: monitoringState.scanCount
-            });
+          if (profitability.isProfitable && passesFilters(load, profitability)) {
+            profitableLoadsFound++;
             
-            newLoadsFound++;
+            const enrichedLoadData = {
+              ...load,
+              ...profitability,
+              priority: calculatePriority(load, profitability),
+              foundAt: startTime
+            };
             
-            // Рассчитываем прибыльность
-            const profitability = calculateProfitability(load);
+            // Отправляем в background script асинхронно (через очередь)
+            queueLoadFoundMessage(enrichedLoadData);
             
-            if (profitability.isProfitable && passesFilters(load, profitability)) {
-              profitableLoadsFound++;
-              
-              const enrichedLoadData = {
-                ...load,
-                ...profitability,
-                priority: calculatePriority(load, profitability),
-                foundAt: Date.now()
-              };
-              
-              // Отправляем в background script асинхронно
-              safeSendMessage({
-                type: 'LOAD_FOUND',
-                data: enrichedLoadData
-              }).catch(error => {
-                console.error('Error sending load data:', error);
-              });
-              
-              console.log('💰 Profitable load found:', enrichedLoadData);
-            }
+            console.log('💰 Profitable load found:', enrichedLoadData);
           }
-          
-        } catch (parseError) {
-          console.error(`Error parsing load element ${i + batchIndex}:`, {
-            error: parseError.message || parseError,
-            stack: parseError.stack,
-            element: element ? {
-              tagName: element.tagName,
-              className: element.className,
-              id: element.id,
-              textContent: element.textContent?.substring(0, 100) + '...'
-            } : 'element is null'
-          });
         }
-      });
-      
-      // Небольшая пауза между батчами для предотвращения блокировки UI
-      if (i + batchSize < loadElements.length) {
-        // Используем Promise для асинхронной обработки
-        setTimeout(() => {}, 0);
+        
+      } catch (parseError) {
+        // Ошибка парсера обычно повторяется на каждой карточке: подробности
+        // (со стеком и текстом карточки) пишем только для первой в скане
+        if (parseErrors++ > 0) {
+          return;
+        }
+        console.error(`Error parsing load element ${index}:`, {
+          error: parseError.message || parseError,
+          stack: parseError.stack,
+          element: element ? {
+            tagName: element.tagName,
+            className: element.className,
+            id: element.id,
+            textContent: element.textContent?.substring(0, 100) + '...'
+          } : 'element is null'
+        });
       }
+    });
+    
+    if (parseErrors > 1) {
+      console.warn(`⚠️ Еще ${parseErrors - 1} карточек не разобрано из-за ошибок в этом скане`);
     }
     
     const endTime = Date.now();
@@ -906,6 +1128,12 @@ function cleanupFoundLoadsCache() {
     monitoringState.foundLoads.set(id, load);
   });
   
+  // Вытесненные грузы снова считаются новыми — карточки нужно разобрать
+  // заново, даже если DOM не менялся
+  if (freshEntries.length < entries.length) {
+    monitoringState.scannedDomVersion = -1;
+  }
+  
   console.log(`Cache cleaned: ${entries.length} -> ${freshEntries.length} entries`);
 }
 
@@ -913,146 +1141,212 @@ function cleanupFoundLoadsCache() {
 function isOnLoadSearchPage() {
   const url = window.location.href;
   
-  // Проверяем URL
-  const validPaths = [
-    '/search',
-    '/loads',
-    '/freight',
-    '/board',
-    '/loadboard'
-  ];
-  
-  const isValidPath = validPaths.some(path => url.includes(path));
-  
-  // Проверяем наличие элементов страницы поиска
-  const searchIndicators = [
-    document.querySelector('[class*="search"]'),
-    document.querySelector('[class*="load"]'),
-    document.querySelector('[class*="freight"]'),
-    document.querySelector('input[type="submit"], button[type="submit"]'),
-    document.querySelector('[class*="filter"]'),
-    document.querySelector('[class*="result"]')
-  ];
-  
-  const hasSearchElements = searchIndicators.some(el => el !== null);
+  // Совпадение по URL достаточно — DOM в этом случае не проверяем
+  if (SEARCH_PAGE_PATHS.some(path => url.includes(path))) {
+    return true;
+  }
   
-  return isValidPath || hasSearchElements;
+  // Проверяем наличие элементов страницы поиска одним запросом
+  return document.querySelector(SEARCH_PAGE_INDICATOR_SELECTOR) !== null;
 }
 
 // Переход на страницу поиска грузов
 function navigateToLoadSearchPage() {
   console.log('🚀 Переходим на страницу поиска грузов...');
   
-  // Пробуем найти ссылку на поиск грузов
-  const searchLinks = [
-    'a[href*="search"]',
-    'a[href*="loads"]',
-    'a[href*="freight"]',
-    'a[href*="board"]',
-    '[class*="search"] a',
-    '[class*="load"] a',
-    '[class*="freight"] a'
-  ];
-  
-  for (const selector of searchLinks) {
-    const link = document.querySelector(selector);
-    if (link) {
-      console.log(`🔗 Найдена ссылка на поиск: ${selector}`);
-      link.click();
-      return;
+  // Пробуем найти ссылку на поиск грузов. Вместо отдельного обхода документа
+  // на каждый селектор — один запрос по объединенному списку; приоритет
+  // селекторов сохраняется проверкой matches() в порядке списка
+  const linkCandidates = document.querySelectorAll(SEARCH_LINK_QUERY);
+  for (const selector of SEARCH_LINK_SELECTORS) {
+    for (const link of linkCandidates) {
+      if (link.matches(selector)) {
+        console.log(`🔗 Найдена ссылка на поиск: ${selector}`);
+        link.click();
+        return;
+      }
     }
   }
   
-  // Если не нашли ссылку, пробуем перейти по прямому URL
-  const baseUrl = window.location.origin;
-  const searchPaths = [
-    '/search',
-    '/loads',
-    '/freight-board',
-    '/loadboard'
-  ];
-  
-  for (const path of searchPaths) {
-    try {
-      window.location.href = baseUrl + path;
-      return;
-    } catch (error) {
-      console.warn(`Не удалось перейти на ${path}:`, error);
-    }
-  }
+  // Если не нашли ссылку, переходим по прямому URL. Присваивание
+  // location.href не бросает исключений для URL того же origin, поэтому
+  // перебор запасных путей через try/catch никогда не шел дальше первого
+  window.location.href = window.location.origin + '/search';
 }
 
 // Попытка обновить поиск
 function attemptRefreshSearch() {
+  // Обновление уже запущено и ждет результатов — повторный клик
+  // только перезапустил бы тот же поиск
+  if (monitoringState.refreshInFlight) {
+    console.log('⏳ Обновление поиска уже выполняется, ждем результатов');
+    return true;
+  }
+  
+  // Страница только что сама обновила контент (результаты еще дорисовываются),
+  // перезапуск поиска сейчас лишь прервал бы загрузку
+  if (Date.now() - monitoringState.lastContentChangeAt < RECENT_CONTENT_WINDOW) {
+    console.log('⏳ Контент страницы только что обновился, обновление поиска не требуется');
+    return false;
+  }
+  
+  // Пустая выдача подряд — увеличиваем паузу между попытками (2с, 4с, ... 60с),
+  // чтобы не перезапускать поиск на каждом сканировании
+  const now = Date.now();
+  if (now < monitoringState.nextRefreshAt) {
+    return false;
+  }
+  monitoringState.refreshBackoff = monitoringState.refreshBackoff
+    ? Math.min(monitoringState.refreshBackoff * 2, REFRESH_BACKOFF_MAX)
+    : REFRESH_BACKOFF_BASE;
+  monitoringState.nextRefreshAt = now + monitoringState.refreshBackoff;
+  
   console.log('🔄 Попытка обновить поиск...');
   
-  // Пробуем найти кнопку поиска/обновления
-  const searchButtons = [
-    'button[type="submit"]',
-    'input[type="submit"]',
-    '[class*="search"][class*="button"]',
-    '[class*="search-btn"]',
-    '[class*="refresh"]',
-    '[class*="reload"]',
-    'button:contains("Search")',
-    'button:contains("Поиск")',
-    'button:contains("Найти")'
-  ];
+  // Сначала пробуем уже найденную кнопку, если SPA ее не перерисовало
+  if (cachedSearchButton && cachedSearchButton.isConnected && !cachedSearchButton.disabled) {
+    console.log('🔍 Нажимаем ранее найденную кнопку поиска');
+    clickSearchButton(cachedSearchButton);
+    return true;
+  }
+  cachedSearchButton = null;
   
-  for (const selector of searchButtons) {
-    try {
-      const button = document.querySelector(selector);
-      if (button && !button.disabled) {
+  // Затем селектор, уже сработавший в прошлый раз
+  if (lastRefreshSelector) {
+    const button = document.querySelector(lastRefreshSelector);
+    if (button && !button.disabled) {
+      console.log(`🔍 Нажимаем кнопку поиска: ${lastRefreshSelector}`);
+      clickSearchButton(button);
+      return true;
+    }
+    lastRefreshSelector = null;
+  }
+  
+  // Пробуем найти кнопку поиска/обновления. Селекторы проверяем одним
+  // запросом по объединенному списку, сохраняя их приоритет через matches()
+  const buttonCandidates = document.querySelectorAll(SEARCH_BUTTON_QUERY);
+  for (const selector of SEARCH_BUTTON_SELECTORS) {
+    for (const button of buttonCandidates) {
+      if (!button.disabled && button.matches(selector)) {
         console.log(`🔍 Нажимаем кнопку поиска: ${selector}`);
-        button.click();
+        lastRefreshSelector = selector;
+        clickSearchButton(button);
         return true;
       }
-    } catch (error) {
-      console.warn(`Ошибка при нажатии кнопки ${selector}:`, error);
+    }
+  }
+  
+  // Кнопки по тексту: один проход по кнопкам вместо селекторов :contains,
+  // которые querySelector все равно отвергает с SyntaxError
+  for (const button of document.querySelectorAll('button')) {
+    if (!button.disabled && SEARCH_BUTTON_TEXT_RE.test(button.textContent)) {
+      console.log(`🔍 Нажимаем кнопку поиска по тексту: ${button.textContent.trim()}`);
+      clickSearchButton(button);
+      return true;
     }
   }
   
   // Если кнопка не найдена, пробуем форму
   const searchForms = document.querySelectorAll('form');
   for (const form of searchForms) {
+    const formText = form.textContent.toLowerCase();
+    if (!formText.includes('search') && !formText.includes('поиск') && !formText.includes('load')) {
+      continue;
+    }
+    
+    // Исключение возможно только при самой отправке, проверку текста не оборачиваем
     try {
-      const formText = form.textContent.toLowerCase();
-      if (formText.includes('search') || formText.includes('поиск') || formText.includes('load')) {
-        console.log('📝 Отправляем форму поиска');
+      console.log('📝 Отправляем форму поиска');
+      // requestSubmit() вызывает событие submit, и SPA обрабатывает поиск
+      // своим запросом; submit() обходит обработчики и перезагружает страницу.
+      // Ожидание результатов запускаем после успешной отправки: если
+      // requestSubmit() бросит исключение, refreshInFlight не останется
+      // взведенным до таймаута ожидания
+      if (typeof form.requestSubmit === 'function') {
+        form.requestSubmit();
+        scanWhenResultsAppear();
+      } else {
         form.submit();
-        return true;
       }
+      return true;
     } catch (error) {
       console.warn('Ошибка отправки формы:', error);
     }
   }
   
   // Последняя попытка - обновить страницу
+  const lastReload = Number(sessionStorage.getItem(RELOAD_STORAGE_KEY)) || 0;
+  if (Date.now() - lastReload < RELOAD_MIN_INTERVAL) {
+    console.log('⏳ Страница недавно перезагружалась, пропускаем перезагрузку');
+    return false;
+  }
+  
   console.log('🔄 Обновляем страницу');
+  sessionStorage.setItem(RELOAD_STORAGE_KEY, String(Date.now()));
   window.location.reload();
   return false;
 }
 
+// Клик по кнопке поиска. Ожидание результатов регистрируется до клика,
+// чтобы не пропустить синхронную перерисовку или мгновенный ответ из кеша
+function clickSearchButton(button) {
+  cachedSearchButton = button;
+  scanWhenResultsAppear();
+  button.click();
+}
+
+// Сканирование сразу после появления результатов обновленного поиска,
+// не дожидаясь следующего (увеличенного после 'no_loads') интервала
+function scanWhenResultsAppear() {
+  monitoringState.refreshInFlight = true;
+  // Обновление завершено, когда появились карточки или когда завершился
+  // сам запрос поиска (пустая выдача карточек не даст). Карточки прежней
+  // выдачи уже на странице, поэтому засчитываем только появившиеся после
+  // изменения DOM. Проигравшее ожидание отменяется, чтобы его наблюдатель
+  // не висел до таймаута
+  const controller = new AbortController();
+  Promise.race([
+    waitForSelector(LOAD_ITEMS_QUERY, 10000, false, controller.signal),
+    waitForSearchResponse(10000, controller.signal)
+  ]).then(found => {
+    controller.abort();
+    if (!found) return false;
+    // Ответ пришел раньше отрисовки карточек, а карточки появляются
+    // не разом: сканируем, когда DOM успокоится, иначе скан застанет
+    // пустой список и поднимет интервал как при 'no_loads'
+    return waitForDomSettle(DOM_SETTLE_DELAY, DOM_SETTLE_MAX_WAIT).then(() => true);
+  }).then(found => {
+    monitoringState.refreshInFlight = false;
+    if (found && monitoringState.isActive) {
+      scheduleNextScan(0);
+    }
+  });
+}
+
+// Отбор настоящих карточек грузов среди найденных по селектору элементов
+function filterValidLoadElements(elements) {
+  return Array.from(elements).filter(el => {
+    // Элемент должен содержать хотя бы Origin или Destination
+    const text = el.textContent || '';
+    const hasLocation = LOCATION_TEXT_RE.test(text);
+    
+    // Элемент должен быть достаточно большим (не пустым)
+    const hasContent = el.childElementCount > 0 || text.length > 20;
+    
+    return hasLocation && hasContent;
+  });
+}
+
 // Поиск элементов грузов на странице
 function findLoadElements() {
   console.log('🔍 Searching for load elements...');
   
-  // Сначала пробуем найти контейнер с результатами поиска
-  const searchContainers = [
-    '.search-results',
-    '[class*="search-result"]',
-    '[class*="result-container"]',
-    '[class*="load-list"]',
-    '[class*="freight-list"]',
-    'main [class*="container"]',
-    '[role="main"]',
-    '#app main',
-    '.content-area'
-  ];
-  
+  // Сначала пробуем найти контейнер с результатами поиска: один запрос по
+  // объединенному списку, приоритет селекторов — проверкой matches()
   let container = document.body;
-  for (const selector of searchContainers) {
-    const found = document.querySelector(selector);
+  const containerCandidates = document.querySelectorAll(SEARCH_CONTAINER_QUERY);
+  for (const selector of SEARCH_CONTAINER_SELECTORS) {
+    const found = Array.prototype.find.call(containerCandidates, el => el.matches(selector));
     if (found) {
       container = found;
       console.log(`📦 Found search container: ${selector}`);
@@ -1067,18 +1361,7 @@ function findLoadElements() {
       console.log(`✅ Found ${elements.length} load elements using selector: ${selector}`);
       
       // Проверяем, что это действительно карточки грузов
-      const validElements = Array.from(elements).filter(el => {
-        // Элемент должен содержать хотя бы Origin или Destination
-        const text = el.textContent || '';
-        const hasLocation = text.includes('Origin') || text.includes('Destination') || 
-                          text.includes(', ') || // Города обычно через запятую
-                          /[A-Z]{2}\s*\d{5}/.test(text); // ZIP коды
-        
-        // Элемент должен быть достаточно большим (не пустым)
-        const hasContent = el.childElementCount > 0 || text.length > 20;
-        
-        return hasLocation && hasContent;
-      });
+      const validElements = filterValidLoadElements(elements);
       
       if (validElements.length > 0) {
         console.log(`✅ Validated ${validElements.length} load elements`);
@@ -1092,19 +1375,35 @@ function findLoadElements() {
   
   const allElements = container.querySelectorAll('div, article, section, tr');
   const potentialLoads = Array.from(allElements).filter(el => {
-    const text = el.textContent || '';
+    // Сначала дешевая структурная проверка: textContent крупного контейнера
+    // собирает текст всего поддерева, и для мелких узлов он не нужен
+    if (el.childElementCount <= 2) {
+      return false;
+    }
     
-    // Проверяем наличие ключевых слов
-    const hasOrigin = text.includes('Origin') || /\b[A-Z][a-z]+(?:ville|ton|burg|city|town)\b/.test(text);
-    const hasDestination = text.includes('Destination') || text.split(',').length > 2;
-    const hasState = /\b[A-Z]{2}\b/.test(text);
-    const hasMiles = /\b\d+\s*mi/i.test(text) || text.includes('miles');
-    const hasDate = /\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}/i.test(text);
+    const text = el.textContent || '';
     
-    // Элемент должен содержать несколько признаков груза
-    const score = [hasOrigin, hasDestination, hasState, hasMiles, hasDate].filter(Boolean).length;
+    // Элемент должен содержать несколько признаков груза: считаем признаки
+    // до второго совпадения, начиная с дешевых проверок подстрок
+    let score = 0;
+    if (text.includes('Origin') || HEURISTIC_CITY_RE.test(text)) {
+      score++;
+    }
+    if (text.includes('miles') || HEURISTIC_MILES_RE.test(text)) {
+      if (++score >= 2) return true;
+    }
+    if (HEURISTIC_STATE_RE.test(text)) {
+      if (++score >= 2) return true;
+    }
+    if (HEURISTIC_DATE_RE.test(text)) {
+      if (++score >= 2) return true;
+    }
+    // split создает массив, поэтому проверяется последним
+    if (text.includes('Destination') || text.split(',').length > 2) {
+      if (++score >= 2) return true;
+    }
     
-    return score >= 2 && el.childElementCount > 2;
+    return false;
   });
   
   if (potentialLoads.length > 0) {
@@ -1128,18 +1427,11 @@ function detectSiteType() {
     return 'freightpower';
   }
   
-  // Определение Ionic приложений
-  const ionicIndicators = [
-    document.querySelector('ion-app'),
-    document.querySelector('ion-content'),
-    document.querySelector('ion-grid'),
-    document.querySelector('ion-row'),
-    document.querySelector('ion-col'),
-    document.querySelector('[class*="ionic"]'),
-    window.Ionic !== undefined
-  ];
-  
-  const isIonic = ionicIndicators.some(indicator => !!indicator);
+  // Определение Ionic приложений: сначала глобальный объект, затем один
+  // запрос по объединенному селектору (массив из querySelector выполнял
+  // все шесть обходов документа даже после первого совпадения)
+  const isIonic = window.Ionic !== undefined ||
+    document.querySelector(IONIC_INDICATOR_SELECTOR) !== null;
   if (isIonic) {
     console.log('🔷 Detected Ionic application');
     return 'ionic';
@@ -1306,7 +1598,7 @@ function parseLothianCard(element) {
     loadData.id = generateLoadId(loadData);
   }
   
-  if (!window.hasMinimalData(loadData)) {
+  if (!hasMinimalData(loadData)) {
     console.warn('⚠️ LOTHIAN карточка не содержит достаточно данных');
     return null;
   }
@@ -1339,38 +1631,39 @@ function parseLoadElementLothian(element) {
   const getText = (sel) => card.querySelector(sel)?.textContent?.trim() || '';
   const getAll = (sel) => Array.from(card.querySelectorAll(sel));
 
+  // Сначала обязательные поля: карточки без них отбрасываем до
+  // извлечения остальных полей и поиска ставки по всему тексту
   const idText = getText('.card_p-elements.loadno_card');
   const id = (idText.match(/\b\d{8,12}\b/) || [null])[0];
 
-  const capacityType = getText('.capacity-type.capacity-type-font') || null;
+  const cities = getAll('.origin_city').map(n => n.textContent.trim()).filter(Boolean);
+  const pickup = cities[0] || null;
+  const delivery = cities[1] || null;
 
-  const milesText = getText('.card-distance[data-testid="card-distance"]');
-  const miles = milesText ? parseInt(milesText.replace(/[^\d]/g, ''), 10) || 0 : 0;
+  if (!id || !pickup || !delivery) {
+    console.debug('LOTHIAN: не хватает обязательных полей', { id, pickup, delivery });
+    return null;
+  }
 
+  const capacityType = getText('.capacity-type.capacity-type-font') || null;
   const weight = getText('.card_p-elements.card-lbs') || null;
 
-  const cities = getAll('.origin_city').map(n => n.textContent.trim()).filter(Boolean);
-  const pickup = cities[0] || null;
-  const delivery = cities[1] || null;
+  // Числовые поля разбираем и сразу валидируем (вне диапазона -> 0)
+  const milesText = getText('.card-distance[data-testid="card-distance"]');
+  const miles = milesText ? parseInt(milesText.replace(/[^\d]/g, ''), 10) || 0 : 0;
+  const validMiles = miles >= LOTHIAN_LIMITS.miles.min && miles <= LOTHIAN_LIMITS.miles.max ? miles : 0;
 
-  const deadheadText = getAll('p.origin_dateTime, .origin_dateTime')
-    .map(n => n.textContent.trim())
-    .find(t => /Deadhead/i.test(t)) || '';
+  // Ищем первый узел с Deadhead без копирования и trim текста всех узлов дат
+  // (p.origin_dateTime уже покрывается селектором .origin_dateTime)
+  const deadheadNode = getAll('.origin_dateTime').find(n => /Deadhead/i.test(n.textContent));
+  const deadheadText = deadheadNode ? deadheadNode.textContent : '';
   const deadhead = (deadheadText.match(/Deadhead\s+(\d+)\s*mi/i) || [0, 0])[1] | 0;
+  const validDeadhead = deadhead >= LOTHIAN_LIMITS.deadhead.min && deadhead <= LOTHIAN_LIMITS.deadhead.max ? deadhead : 0;
 
   const fullText = card.textContent || '';
   const rateMatch = fullText.match(/\$\s*([\d,]+(?:\.\d{2})?)(?=\D|$)/);
   const rate = rateMatch ? parseFloat(rateMatch[1].replace(/,/g, '')) : 0;
-
-  // Валидации
-  const validRate = rate >= 50 && rate <= 50000 ? rate : 0;
-  const validMiles = miles >= 1 && miles <= 5000 ? miles : 0;
-  const validDeadhead = deadhead >= 0 && deadhead <= 1000 ? deadhead : 0;
-
-  if (!id || !pickup || !delivery) {
-    console.debug('LOTHIAN: не хватает обязательных полей', { id, pickup, delivery });
-    return null;
-  }
+  const validRate = rate >= LOTHIAN_LIMITS.rate.min && rate <= LOTHIAN_LIMITS.rate.max ? rate : 0;
 
   return {
     id,
@@ -1674,7 +1967,7 @@ window.testIonicParsing = testIonicParsing;
 
 // Специальный парсинг для Ionic приложений
 function parseLoadElementIonic(element) {
-  console.log('🔷 Парсинг Ionic элемента...', element);
+  debugLog('🔷 Парсинг Ionic элемента...', element);
   
   const loadData = {
     id: null,
@@ -1693,7 +1986,7 @@ function parseLoadElementIonic(element) {
   };
   
   const fullText = element.textContent || '';
-  console.log('📝 Полный текст Ionic элемента:', fullText);
+  debugLog('📝 Полный текст Ionic элемента:', fullText);
   
   // Специальные регулярные выражения для парсинга строки Ionic
   // Пример: "4007567920Power Only$909521 miles26,000 lbsHigh ValueDALLAS, TXAug 26 12:01am - 1:00amDrop Empty Trailer, Pick Up Loaded TrailerBIRMINGHAM, MOAug 26 12:31am - 12:00pm"
@@ -1702,35 +1995,35 @@ function parseLoadElementIonic(element) {
   const idMatch = fullText.match(/^(\d{10,})/);
   if (idMatch) {
     loadData.id = idMatch[1];
-    console.log('🆔 Найден ID:', loadData.id);
+    debugLog('🆔 Найден ID:', loadData.id);
   }
   
   // Тип груза (после ID, перед $)
   const typeMatch = fullText.match(/^\d*([A-Za-z\s]+)\$/);
   if (typeMatch) {
     loadData.capacityType = typeMatch[1].trim();
-    console.log('🚚 Найден тип:', loadData.capacityType);
+    debugLog('🚚 Найден тип:', loadData.capacityType);
   }
   
   // Ставка ($ + число, но не включая следующие цифры миль)
   const rateMatch = fullText.match(/\$(\d{1,4})(?=\d+\s|[a-zA-Z])/);
   if (rateMatch) {
     loadData.rate = parseFloat(rateMatch[1]);
-    console.log('💰 Найдена ставка:', loadData.rate);
+    debugLog('💰 Найдена ставка:', loadData.rate);
   }
   
   // Мили (число перед "miles")
   const milesMatch = fullText.match(/(\d{1,4})\s*miles/i);
   if (milesMatch) {
     loadData.miles = parseInt(milesMatch[1]);
-    console.log('📏 Найдены мили:', loadData.miles);
+    debugLog('📏 Найдены мили:', loadData.miles);
   }
   
   // Deadhead (если есть)
   const deadheadMatch = fullText.match(/deadhead\s*(\d+)\s*mi/i);
   if (deadheadMatch) {
     loadData.deadhead = parseInt(deadheadMatch[1]);
-    console.log('🚚 Найден deadhead:', loadData.deadhead);
+    debugLog('🚚 Найден deadhead:', loadData.deadhead);
   }
   
   // Вес груза (если есть)
@@ -1738,7 +2031,7 @@ function parseLoadElementIonic(element) {
   if (weightMatch) {
     const weight = weightMatch[1].replace(/,/g, '');
     loadData.weight = parseInt(weight);
-    console.log('⚖️ Найден вес:', loadData.weight, 'lbs');
+    debugLog('⚖️ Найден вес:', loadData.weight, 'lbs');
   }
   
   // Локации (ГОРОД, ШТАТ)
@@ -1748,7 +2041,7 @@ function parseLoadElementIonic(element) {
   if (locations.length >= 2) {
     loadData.pickup = `${locations[0][1].trim()}, ${locations[0][2]}`;
     loadData.delivery = `${locations[1][1].trim()}, ${locations[1][2]}`;
-    console.log('📍 Найдены локации:', { pickup: loadData.pickup, delivery: loadData.delivery });
+    debugLog('📍 Найдены локации:', { pickup: loadData.pickup, delivery: loadData.delivery });
   }
   
   // Даты (формат: Aug 26 12:01am)
@@ -1760,7 +2053,7 @@ function parseLoadElementIonic(element) {
     if (dates.length > 1) {
       loadData.deliveryDate = dates[1][0];
     }
-    console.log('📅 Найдены даты:', { pickup: loadData.pickupDate, delivery: loadData.deliveryDate });
+    debugLog('📅 Найдены даты:', { pickup: loadData.pickupDate, delivery: loadData.deliveryDate });
   }
   
   // Если не удалось найти данные в одной строке, пробуем альтернативный поиск
@@ -1778,35 +2071,85 @@ function parseLoadElementIonic(element) {
     loadData.id = generateLoadId(loadData);
   }
   
-  console.log('✅ Ionic груз распарсен:', loadData);
+  debugLog('✅ Ionic груз распарсен:', loadData);
   return loadData;
 }
 
-// Парсинг данных груза из элемента (улучшенная версия)
-function parseLoadElement(element) {
-  const siteType = detectSiteType();
+// Парсинг данных груза из элемента (улучшенная версия).
+// scanForLoads передает тип сайта, определенный один раз на весь скан
+function parseLoadElement(element, siteType = detectSiteType()) {
   let load = null;
 
   if (siteType === 'freightpower') {
     load = parseLoadElementLothian(element);
   } else if (siteType === 'ionic') {
     load = parseLoadElementIonic(element);
+  } else {
+    load = parseLoadElementGeneric(element);
   }
 
   if (!load || !load.pickup || !load.delivery) {
-    const text = (getCardRoot(element) || element)?.textContent || '';
-    const fallback = parseLoadFromText(text);
+    // Корень карточки и ее текст получаем один раз для текстового fallback
+    const card = getCardRoot(element) || element;
+    const fallback = parseLoadFromText(card?.textContent || '');
     if (fallback?.pickup && fallback?.delivery) {
-      load = { ...fallback, element: getCardRoot(element) || element };
+      load = { ...fallback, element: card };
     }
   }
   // Валидация с использованием hasMinimalData
-  if (!load || !window.hasMinimalData(load)) {
+  if (!load || !hasMinimalData(load)) {
     return null;
   }
 
   return load;
-}  
+}
+
+// Поля карточки, извлекаемые универсальным парсером по SELECTORS
+const GENERIC_FIELD_GROUPS = [
+  'load_id',
+  'capacity_type',
+  'pickup_location',
+  'delivery_location',
+  'pickup_date',
+  'delivery_date',
+  'miles',
+  'deadhead',
+  'rate'
+];
+
+// План извлечения: списки селекторов, их объединенный запрос и вариант с
+// data-testid первыми резолвятся один раз, а не на каждое поле каждой карточки
+const GENERIC_FIELD_PLAN = GENERIC_FIELD_GROUPS.map(group => {
+  const selectors = SELECTORS[group];
+  return {
+    group,
+    selectors,
+    testIdFirst: TESTID_FIRST_SELECTORS.get(selectors) || selectors,
+    joined: JOINED_SELECTORS.get(selectors)
+  };
+});
+
+// Универсальный парсинг карточки по SELECTORS (для сайтов без специального парсера)
+function parseLoadElementGeneric(element) {
+  const loadData = {
+    id: null,
+    capacityType: null,
+    pickup: null,
+    delivery: null,
+    pickupDate: null,
+    deliveryDate: null,
+    miles: 0,
+    deadhead: 0,
+    rate: 0,
+    originRadius: null,
+    destinationRadius: null,
+    element: element
+  };
+  
+  // Текст всех полей извлекаем одним вызовом, а не отдельным поиском на каждое поле
+  const fields = extractFields(element, GENERIC_FIELD_PLAN);
+  let extractedId = fields.load_id;
+  
   // Дополнительные попытки найти ID
   if (!extractedId) {
     const idCandidates = [
@@ -1833,8 +2176,8 @@ function parseLoadElement(element) {
   }
   
   // Улучшенное извлечение мест погрузки/разгрузки
-  loadData.pickup = extractLocationText(element, SELECTORS.pickup_location, 'pickup');
-  loadData.delivery = extractLocationText(element, SELECTORS.delivery_location, 'delivery');
+  loadData.pickup = cleanLocationText(fields.pickup_location);
+  loadData.delivery = cleanLocationText(fields.delivery_location);
   
   // Если не удалось найти pickup/delivery через селекторы, используем heuristic search
   if (!loadData.pickup || !loadData.delivery) {
@@ -1844,20 +2187,20 @@ function parseLoadElement(element) {
   }
   
   // Извлекаем тип груза
-  loadData.capacityType = extractText(element, SELECTORS.capacity_type) || 'Сухой фургон';
+  loadData.capacityType = fields.capacity_type || 'Сухой фургон';
   
   // Извлекаем даты
-  loadData.pickupDate = extractText(element, SELECTORS.pickup_date);
-  loadData.deliveryDate = extractText(element, SELECTORS.delivery_date);
+  loadData.pickupDate = fields.pickup_date;
+  loadData.deliveryDate = fields.delivery_date;
   
   // Улучшенное извлечение числовых данных
-  const milesText = extractText(element, SELECTORS.miles);
+  const milesText = fields.miles;
   loadData.miles = parseNumberImproved(milesText, 'miles');
   
-  const deadheadText = extractText(element, SELECTORS.deadhead);
+  const deadheadText = fields.deadhead;
   loadData.deadhead = parseNumberImproved(deadheadText, 'deadhead');
   
-  const rateText = extractText(element, SELECTORS.rate);
+  const rateText = fields.rate;
   loadData.rate = parseNumberImproved(rateText, 'rate');
   
   // Если мили = 0, попробуем найти их другими способами
@@ -1871,7 +2214,7 @@ function parseLoadElement(element) {
   }
   
   // Извлекаем радиусы
-  const radiusElements = element.querySelectorAll(SELECTORS.radius.join(', '));
+  const radiusElements = element.querySelectorAll(JOINED_SELECTORS.get(SELECTORS.radius));
   if (radiusElements.length >= 2) {
     loadData.originRadius = extractRadius(radiusElements[0]);
     loadData.destinationRadius = extractRadius(radiusElements[1]);
@@ -1882,24 +2225,24 @@ function parseLoadElement(element) {
   
   // Валидация данных
   if (!loadData.pickup || !loadData.delivery) {
-    console.warn('❌ Отсутствуют обязательные данные (pickup/delivery):', JSON.stringify({
+    console.warn('❌ Отсутствуют обязательные данные (pickup/delivery):', {
       pickup: loadData.pickup,
       delivery: loadData.delivery,
       elementHTML: element.innerHTML.substring(0, 200)
-    }, null, 2));
+    });
     return null;
   }
   
   // Финальная проверка корректности данных
   if (loadData.miles > 5000 || loadData.rate > 50000) {
-    console.warn('⚠️ Подозрительно большие значения:', JSON.stringify({
+    console.warn('⚠️ Подозрительно большие значения:', {
       id: loadData.id,
       miles: loadData.miles,
       rate: loadData.rate,
       milesText: milesText,
       rateText: rateText,
       deadheadText: deadheadText
-    }, null, 2));
+    });
     
     // Если значения явно неправильные, сбрасываем их
     if (loadData.miles > 5000) {
@@ -1912,13 +2255,13 @@ function parseLoadElement(element) {
     }
   }
   
-  console.log('✅ Груз успешно распарсен:', JSON.stringify({
+  debugLog('✅ Груз успешно распарсен:', {
     id: loadData.id,
     pickup: loadData.pickup,
     delivery: loadData.delivery,
     miles: loadData.miles,
     rate: loadData.rate
-  }, null, 2));
+  });
   
   return loadData;
 }
@@ -1956,12 +2299,12 @@ function generateLoadId(data) {
     // Создаем ID
     const generatedId = idParts.join('-').replace(/[^\w\-$]/g, '');
     
-    console.log('🔧 Generated load ID:', generatedId, 'from data:', JSON.stringify({
+    debugLog('🔧 Generated load ID:', generatedId, 'from data:', {
       pickup: data.pickup,
       delivery: data.delivery,
       miles: data.miles,
       rate: data.rate
-    }, null, 2));
+    });
     
     return generatedId;
     
@@ -1972,9 +2315,8 @@ function generateLoadId(data) {
   }
 }
 
-// Улучшенное извлечение текста местоположения
-function extractLocationText(element, selectors, type) {
-  const text = extractText(element, selectors);
+// Очистка и валидация извлеченного текста местоположения
+function cleanLocationText(text) {
   if (!text) return null;
   
   // Очищаем и валидируем местоположение
@@ -2022,34 +2364,25 @@ function extractLocationsHeuristic(element) {
 function parseNumberImproved(text, type) {
   if (!text) return 0;
   
-  console.log(`🔢 Парсинг ${type}: "${text}"`);
+  const cacheKey = type + '|' + text;
+  const cached = PARSED_NUMBER_CACHE.get(cacheKey);
+  if (cached !== undefined) {
+    return cached;
+  }
   
-  let result = 0;
+  debugLog(`🔢 Парсинг ${type}: "${text}"`);
   
-  // Определяем разумные диапазоны для каждого типа
-  const ranges = {
-    rate: { min: 50, max: 1000000 }, // Увеличиваем максимум для обработки центов
-    price: { min: 50, max: 1000000 }, // Увеличиваем максимум для обработки центов
-    miles: { min: 1, max: 5000 },
-    distance: { min: 1, max: 5000 },
-    deadhead: { min: 0, max: 250 }
-  };
+  let result = 0;
   
   // Специальная обработка для разных типов
   if (type === 'rate' || type === 'price') {
     // Ищем числа с знаком доллара - берем ПЕРВОЕ число после $
-    // Например, из "$761413 miles" берем только 761
+    // Например, из "$761413 miles" берем только 761. Отдельный поиск
+    // "$1,234.56" не нужен: любой такой текст совпадает уже с этим шаблоном
     const rateMatch = text.match(/\$\s*(\d{1,6})/);
     if (rateMatch) {
       result = parseFloat(rateMatch[1]);
-      console.log(`💵 Извлечена ставка: $${result} из "${text}"`);
-    } else {
-      // Если нет $, ищем отдельные элементы с долларом
-      const dollarMatch = text.match(/\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)/);
-      if (dollarMatch) {
-        const cleaned = dollarMatch[1].replace(/,/g, '');
-        result = parseFloat(cleaned);
-      }
+      debugLog(`💵 Извлечена ставка: $${result} из "${text}"`);
     }
   } else if (type === 'miles' || type === 'distance') {
     // Ищем числа со словом "miles" или "mi"
@@ -2064,7 +2397,7 @@ function parseNumberImproved(text, type) {
         for (const num of numbers) {
           const cleaned = num.replace(/,/g, '');
           const parsed = parseFloat(cleaned);
-          if (parsed >= ranges.miles.min && parsed <= ranges.miles.max) {
+          if (parsed >= NUMBER_RANGES.miles.min && parsed <= NUMBER_RANGES.miles.max) {
             result = parsed;
             break;
           }
@@ -2076,7 +2409,7 @@ function parseNumberImproved(text, type) {
     const deadheadMatch = text.match(/Deadhead\s+(\d+)\s*mi/i);
     if (deadheadMatch) {
       result = parseFloat(deadheadMatch[1]);
-      console.log(`🚚 Извлечен deadhead: ${result} mi из "${text}"`);
+      debugLog(`🚚 Извлечен deadhead: ${result} mi из "${text}"`);
     }
     // Если не нашли, результат остается 0
   } else {
@@ -2103,7 +2436,7 @@ function parseNumberImproved(text, type) {
   result = isNaN(result) ? 0 : result;
   
   // Проверяем диапазоны и выдаем предупреждение если значение вне диапазона
-  const range = ranges[type];
+  const range = NUMBER_RANGES[type];
   if (range && result > 0) {
     if (result < range.min || result > range.max) {
       console.warn(`⚠️ ${type} вне ожидаемого диапазона [${range.min}-${range.max}]: ${result}`);
@@ -2121,7 +2454,14 @@ function parseNumberImproved(text, type) {
     }
   }
   
-  console.log(`✅ ${type}: "${text}" -> ${result}`);
+  debugLog(`✅ ${type}: "${text}" -> ${result}`);
+  
+  // Map хранит порядок вставки — при переполнении удаляем самую старую запись
+  if (PARSED_NUMBER_CACHE.size >= PARSED_NUMBER_CACHE_LIMIT) {
+    PARSED_NUMBER_CACHE.delete(PARSED_NUMBER_CACHE.keys().next().value);
+  }
+  PARSED_NUMBER_CACHE.set(cacheKey, result);
+  
   return result;
 }
 
@@ -2185,59 +2525,52 @@ function extractRadius(element) {
   return match ? parseInt(match[1]) : null;
 }
 
-// Извлечение текста из элемента по селекторам
-function extractText(parentElement, selectors) {
-  for (const selector of selectors) {
-    try {
-      let elements = [];
-      
-      // Обработка специальных селекторов
-      if (selector.includes(':contains(')) {
-        // Парсим селектор с :contains()
-        const match = selector.match(/(.*):\contains\("([^"]+)"\)(.*)/);
-        if (match) {
-          const [, prefix, text, suffix] = match;
-          const baseSelector = prefix || '*';
-          const candidates = parentElement.querySelectorAll(baseSelector);
-          
-          for (const el of candidates) {
-            if (el.textContent && el.textContent.includes(text)) {
-              if (suffix) {
-                // Если есть суффикс (например, ~ * или + *), ищем соседние элементы
-                if (suffix.trim() === '~ *') {
-                  // Следующие соседние элементы
-                  let sibling = el.nextElementSibling;
-                  while (sibling) {
-                    elements.push(sibling);
-                    sibling = sibling.nextElementSibling;
-                  }
-                } else if (suffix.trim() === '+ *') {
-                  // Непосредственно следующий элемент
-                  if (el.nextElementSibling) {
-                    elements.push(el.nextElementSibling);
-                  }
-                }
-              } else {
-                elements.push(el);
-              }
-            }
-          }
-        }
-      } else {
-        // Обычный селектор
-        elements = Array.from(parentElement.querySelectorAll(selector));
+// Извлечение текста сразу для нескольких полей по заранее построенному плану
+function extractFields(parentElement, plan) {
+  const fields = {};
+  const usesTestIds = monitoringState.usesTestIds;
+  for (const field of plan) {
+    fields[field.group] = extractTextJoined(
+      parentElement,
+      usesTestIds ? field.testIdFirst : field.selectors,
+      field.joined
+    );
+  }
+  return fields;
+}
+
+// Извлечение текста по группе SELECTORS за один обход: кандидаты всех
+// селекторов группы находятся одним запросом, а приоритет селекторов
+// сохраняется проверкой matches() в порядке списка
+function extractTextJoined(parentElement, selectors, joined) {
+  const hot = HOT_SELECTORS.get(selectors);
+  if (hot) {
+    // Проверяем все совпадения, как и полный обход ниже: первое может
+    // оказаться пустым или заглушкой, а текст — в следующем
+    for (const el of parentElement.querySelectorAll(hot)) {
+      const text = extractTextFromElement(el);
+      if (text) {
+        return text;
       }
-      
-      // Проверяем найденные элементы
-      for (const el of elements) {
+    }
+    // Промах — разметка могла измениться, ищем победителя заново
+    HOT_SELECTORS.delete(selectors);
+  }
+  
+  const candidates = parentElement.querySelectorAll(joined);
+  if (candidates.length === 0) {
+    return null;
+  }
+  
+  for (const selector of selectors) {
+    for (const el of candidates) {
+      if (el.matches(selector)) {
         const text = extractTextFromElement(el);
         if (text) {
+          HOT_SELECTORS.set(selectors, selector);
           return text;
         }
       }
-    } catch (e) {
-      // Игнорируем ошибки селекторов и продолжаем
-      console.debug(`Selector error for "${selector}":`, e.message);
     }
   }
   
@@ -2248,9 +2581,9 @@ function extractText(parentElement, selectors) {
 function extractTextFromElement(element) {
   if (!element) return null;
   
-  // Для input/select элементов берем value
+  // Для input/select элементов берем value (обрезанный, как и текст ниже)
   if (element.tagName === 'INPUT' || element.tagName === 'SELECT') {
-    return element.value || null;
+    return element.value.trim() || null;
   }
   
   // Для элементов с одним текстовым узлом
@@ -2259,6 +2592,12 @@ function extractTextFromElement(element) {
     return text || null;
   }
   
+  // Без вложенных labels клон не нужен - читаем текст напрямую
+  if (!element.querySelector('label')) {
+    const text = element.textContent.trim();
+    return text || null;
+  }
+
   // Для сложных элементов ищем текст, исключая вложенные labels
   const clonedElement = element.cloneNode(true);
   const labels = clonedElement.querySelectorAll('label');
@@ -2365,52 +2704,56 @@ function passesFilters(load, profitability) {
   
   // Фильтр по регионам (улучшенная версия)
   if (settings.regions && settings.regions.length > 0) {
-    const matchesRegion = settings.regions.some(region => {
-      const regionLower = region.trim().toLowerCase();
-      
-      // Пустые значения пропускаем
-      if (!regionLower) return false;
-      
-      // Проверяем точное совпадение штатов (сокращения)
-      if (regionLower.length === 2) {
-        const regionUpper = regionLower.toUpperCase();
-        // Проверяем в тексте pickup и delivery
-        if ((load.pickup && load.pickup.includes(regionUpper)) || 
-            (load.delivery && load.delivery.includes(regionUpper))) {
-          return true;
-        }
-      }
-      
-      // Проверяем вхождение в названия городов/локаций
-      const pickupMatch = load.pickup && load.pickup.toLowerCase().includes(regionLower);
-      const deliveryMatch = load.delivery && load.delivery.toLowerCase().includes(regionLower);
-      
-      return pickupMatch || deliveryMatch;
-    });
+    const regionMatcher = getRegionMatcher(settings.regions);
+    
+    // Одна проверка регулярным выражением на локацию вместо перебора регионов.
+    // Сокращения штатов ("IL") отдельно не проверяем: совпадение в исходном
+    // регистре всегда является и совпадением без учета регистра
+    const matchesRegion = regionMatcher !== null && (
+      (!!load.pickup && regionMatcher.test(load.pickup)) ||
+      (!!load.delivery && regionMatcher.test(load.delivery))
+    );
     
     if (!matchesRegion) {
-      console.log('🚫 Load filtered out by region:', JSON.stringify({ 
+      debugLog('🚫 Load filtered out by region:', {
         loadRegions: {
           pickup: load.pickup,
           delivery: load.delivery
         },
         filterRegions: settings.regions
-      }, null, 2));
+      });
       return false;
     } else {
-      console.log('✅ Load matches region filter:', JSON.stringify({
+      debugLog('✅ Load matches region filter:', {
         loadRegions: {
           pickup: load.pickup,
           delivery: load.delivery
         },
         filterRegions: settings.regions
-      }, null, 2));
+      });
     }
   }
   
   return true;
 }
 
+// Регулярное выражение для регионов фильтра (с кешированием).
+// Возвращает null, если непустых регионов нет
+function getRegionMatcher(regions) {
+  if (regionMatcherCache.source !== regions) {
+    const alternatives = regions
+      .map(region => region.trim())
+      .filter(Boolean)
+      .map(region => region.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+    
+    regionMatcherCache = {
+      source: regions,
+      matcher: alternatives.length > 0 ? new RegExp(alternatives.join('|'), 'i') : null
+    };
+  }
+  return regionMatcherCache.matcher;
+}
+
 // Адаптивная настройка интервала сканирования (оптимизированная версия)
 function adjustScanInterval(result) {
   const currentInterval = monitoringState.adaptiveInterval;
@@ -2500,10 +2843,11 @@ function showMonitoringIndicator() {
   
   document.body.appendChild(indicator);
   
-  // Обновляем счетчик сканирований
-  setInterval(() => {
-    const counter = document.getElementById('scan-counter');
-    if (counter && monitoringState.isActive) {
+  // Обновляем счетчик сканирований. Элемент счетчика находим один раз,
+  // а интервал пересоздается только вместе с индикатором
+  const counter = indicator.querySelector('#scan-counter');
+  monitoringState.indicatorInterval = setInterval(() => {
+    if (monitoringState.isActive) {
       counter.textContent = monitoringState.scanCount;
     }
   }, 1000);
@@ -2511,6 +2855,11 @@ function showMonitoringIndicator() {
 
 // Скрытие индикатора мониторинга
 function hideMonitoringIndicator() {
+  if (monitoringState.indicatorInterval) {
+    clearInterval(monitoringState.indicatorInterval);
+    monitoringState.indicatorInterval = null;
+  }
+  
   const indicator = document.getElementById('freightpower-monitor-indicator');
   if (indicator) {
     indicator.remove();
@@ -2554,6 +2903,120 @@ function playAlertSound() {
   }
 }
 
+// Ожидание появления элемента по селектору. Возвращает найденный элемент
+// или null, если за timeout миллисекунд он так и не появился либо ожидание
+// отменено через signal (AbortSignal). При checkExisting = false уже
+// присутствующий элемент не засчитывается: проверка выполняется только
+// после очередного изменения DOM
+function waitForSelector(selector, timeout = 5000, checkExisting = true, signal = null) {
+  const existing = checkExisting && document.querySelector(selector);
+  if (existing) {
+    return Promise.resolve(existing);
+  }
+  if (signal?.aborted) {
+    return Promise.resolve(null);
+  }
+  
+  return new Promise(resolve => {
+    const finish = result => {
+      observer.disconnect();
+      clearTimeout(timer);
+      signal?.removeEventListener('abort', onAbort);
+      resolve(result);
+    };
+    const onAbort = () => finish(null);
+    
+    const observer = new MutationObserver(() => {
+      const found = document.querySelector(selector);
+      if (found) {
+        finish(found);
+      }
+    });
+    
+    const timer = setTimeout(() => finish(null), timeout);
+    signal?.addEventListener('abort', onAbort);
+    
+    observer.observe(document.body, { childList: true, subtree: true });
+  });
+}
+
+// Ожидание, пока DOM страницы успокоится: изменений нет quietPeriod
+// миллисекунд, но не дольше maxWait
+function waitForDomSettle(quietPeriod = DOM_SETTLE_DELAY, maxWait = DOM_SETTLE_MAX_WAIT) {
+  return new Promise(resolve => {
+    const finish = () => {
+      observer.disconnect();
+      clearTimeout(quietTimer);
+      clearTimeout(maxTimer);
+      resolve();
+    };
+    
+    let quietTimer = setTimeout(finish, quietPeriod);
+    const maxTimer = setTimeout(finish, maxWait);
+    
+    const observer = new MutationObserver(mutations => {
+      if (mutations.some(isPageMutation)) {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, quietPeriod);
+      }
+    });
+    
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+  });
+}
+
+// Проверка авторизации после SPA-навигации: вместо фиксированной паузы
+// ждем появления формы входа или элементов авторизованного приложения
+// (URL страницы входа detectLogin проверяет сразу). Вызывается до того, как
+// роутер перерисует страницу, поэтому элементы старой страницы не
+// засчитываем и ждем первого изменения DOM после навигации
+function checkLoginAfterNavigation() {
+  waitForSelector(`${STRONG_AUTH_SELECTOR}, ${LOGIN_FORM_SELECTOR}`, 1000, false)
+    .then(() => checkLoginStatus(true));
+}
+
+// Ожидание завершения fetch/XHR запроса поиска по Resource Timing.
+// Возвращает true, если запрос завершился за timeout миллисекунд, и false
+// по таймауту или при отмене через signal (AbortSignal)
+function waitForSearchResponse(timeout = 10000, signal = null) {
+  if (signal?.aborted) {
+    return Promise.resolve(false);
+  }
+  
+  return new Promise(resolve => {
+    const finish = result => {
+      observer.disconnect();
+      clearTimeout(timer);
+      signal?.removeEventListener('abort', onAbort);
+      resolve(result);
+    };
+    const onAbort = () => finish(false);
+    
+    const observer = new PerformanceObserver(list => {
+      const finished = list.getEntries().some(entry =>
+        (entry.initiatorType === 'fetch' || entry.initiatorType === 'xmlhttprequest') &&
+        SEARCH_REQUEST_RE.test(new URL(entry.name, location.href).pathname)
+      );
+      if (finished) {
+        finish(true);
+      }
+    });
+    
+    const timer = setTimeout(() => finish(false), timeout);
+    signal?.addEventListener('abort', onAbort);
+    
+    observer.observe({ type: 'resource' });
+  });
+}
+
+// Изменение DOM страницы, а не индикатора мониторинга расширения
+function isPageMutation(mutation) {
+  const target = mutation.target.nodeType === Node.ELEMENT_NODE
+    ? mutation.target
+    : mutation.target.parentElement;
+  return !target || !target.closest('#freightpower-monitor-indicator');
+}
+
 // Наблюдение за изменениями страницы
 function observePageChanges() {
   console.log('👁️ Starting DOM observer...');
@@ -2564,22 +3027,34 @@ function observePageChanges() {
     const url = location.href;
     if (url !== lastUrl) {
       lastUrl = url;
+      monitoringState.usesTestIds = null;
+      // Проверка диапазонов зависит от типа сайта — сбрасываем кеш чисел
+      PARSED_NUMBER_CACHE.clear();
+      HOT_SELECTORS.clear();
       console.log('📍 URL changed:', url);
       
       // Проверяем, находимся ли мы на странице поиска
       if (url.includes('/search') || url.includes('/app/search')) {
         console.log('🔍 On search page, checking for results...');
-        setTimeout(() => {
+        // Сканируем, как только появятся карточки, а не через фиксированную паузу.
+        // По таймауту сканируем все равно — scanForLoads сам обработает пустую выдачу
+        waitForSelector(LOAD_ITEMS_QUERY, 10000).then(() => {
           if (monitoringState.isActive) {
             scanForLoads();
           }
-        }, 1000);
+        });
       }
     }
   }).observe(document, {subtree: true, childList: true});
   
   // Создаем основной наблюдатель за DOM
   const observer = new MutationObserver((mutations) => {
+    // Счетчик в нашем индикаторе обновляется каждую секунду — это не
+    // изменение выдачи
+    if (mutations.some(isPageMutation)) {
+      monitoringState.domVersion++;
+    }
+    
     // Проверяем, были ли добавлены новые элементы
     let hasNewContent = false;
     
@@ -2590,8 +3065,7 @@ function observePageChanges() {
           if (node.nodeType === Node.ELEMENT_NODE) {
             const text = node.textContent || '';
             // Ищем признаки грузов
-            if (text.includes('Origin') || text.includes('Destination') || 
-                text.includes('miles') || /\$\d+/.test(text) ||
+            if (LOAD_TEXT_INDICATOR_RE.test(text) ||
                 node.querySelector && node.querySelector('[class*="load"], [class*="freight"], [class*="card"]')) {
               hasNewContent = true;
               break;
@@ -2603,20 +3077,25 @@ function observePageChanges() {
       if (hasNewContent) break;
     }
     
-    // Если обнаружен новый контент и мониторинг активен
-    if (hasNewContent && monitoringState.isActive && !monitoringState.pendingScan) {
-      console.log('🆕 New content detected, scheduling scan...');
-      
-      // Устанавливаем флаг, чтобы избежать множественных сканирований
-      monitoringState.pendingScan = true;
-      
-      // Ждем немного, чтобы страница полностью обновилась
-      setTimeout(() => {
-        monitoringState.pendingScan = false;
-        if (monitoringState.isActive) {
-          scanForLoads();
-        }
-      }, 500);
+    if (hasNewContent) {
+      monitoringState.lastContentChangeAt = Date.now();
+    }
+    
+    // Если обнаружен новый контент и мониторинг активен. Пока ждем результатов
+    // обновления поиска, сканирование запустит scanWhenResultsAppear
+    if (hasNewContent && monitoringState.isActive && !monitoringState.pendingScan &&
+        !monitoringState.refreshInFlight) {
+      // Вместо фиксированной паузы ждем, пока DOM успокоится: каждое новое
+      // изменение переносит запланированный скан. Скан идет через обычный
+      // scheduleNextScan, поэтому не пересекается с плановым и не сбивает его
+      const now = Date.now();
+      if (!monitoringState.settleStartedAt) {
+        monitoringState.settleStartedAt = now;
+        console.log('🆕 New content detected, scheduling scan...');
+      }
+      if (now - monitoringState.settleStartedAt < DOM_SETTLE_MAX_WAIT) {
+        scheduleNextScan(DOM_SETTLE_DELAY);
+      }
     }
   });
   
@@ -2624,6 +3103,7 @@ function observePageChanges() {
   const config = {
     childList: true,
     subtree: true,
+    characterData: true, // Обновление текста карточек на месте тоже меняет domVersion
     attributes: true,
     attributeFilter: ['class', 'style'] // Отслеживаем изменения классов и стилей
   };
@@ -2652,12 +3132,20 @@ setInterval(() => {
   const now = Date.now();
   const maxAge = 30 * 60 * 1000; // 30 минут
   
+  let evicted = false;
   for (const [loadId, loadData] of monitoringState.foundLoads.entries()) {
     if (now - loadData.foundAt > maxAge) {
       monitoringState.foundLoads.delete(loadId);
+      evicted = true;
     }
   }
   
+  // Как и в cleanupFoundLoadsCache: вытесненные грузы снова считаются
+  // новыми, поэтому карточки разбираем заново, даже если DOM не менялся
+  if (evicted) {
+    monitoringState.scannedDomVersion = -1;
+  }
+  
   // Очищаем throttle кеш от старых записей
   for (const [key, timestamp] of logThrottle.entries()) {
     if (now - timestamp > maxAge) {
@@ -2695,24 +3183,33 @@ function diagnosePage() {
   // Ищем все элементы, которые могут быть карточками
   const potentialCards = [];
   
-  // Поиск по классам
+  // Поиск по классам: один проход по объединенному селектору вместо
+  // отдельного querySelectorAll на каждый шаблон. Элемент с несколькими
+  // подходящими классами учитывается как карточка один раз
   const classPatterns = ['card', 'load', 'freight', 'result', 'item', 'row'];
-  classPatterns.forEach(pattern => {
-    const elements = document.querySelectorAll(`[class*="${pattern}"]`);
-    if (elements.length > 0) {
-      console.log(`🎯 Found ${elements.length} elements with class containing "${pattern}"`);
-      elements.forEach(el => {
-        if (el.textContent.length > 50 && el.childElementCount > 2) {
-          potentialCards.push({
-            element: el,
-            selector: `[class*="${pattern}"]`,
-            className: el.className
-          });
-        }
+  const patternCounts = Object.fromEntries(classPatterns.map(pattern => [pattern, 0]));
+  const cardQuery = classPatterns.map(pattern => `[class*="${pattern}"]`).join(', ');
+  
+  document.querySelectorAll(cardQuery).forEach(el => {
+    const classAttr = el.getAttribute('class') || '';
+    const matched = classPatterns.filter(pattern => classAttr.includes(pattern));
+    matched.forEach(pattern => patternCounts[pattern]++);
+    
+    if (matched.length > 0 && el.childElementCount > 2 && el.textContent.length > 50) {
+      potentialCards.push({
+        element: el,
+        selector: `[class*="${matched[0]}"]`,
+        className: el.className
       });
     }
   });
   
+  classPatterns.forEach(pattern => {
+    if (patternCounts[pattern] > 0) {
+      console.log(`🎯 Found ${patternCounts[pattern]} elements with class containing "${pattern}"`);
+    }
+  });
+  
   // Анализируем найденные потенциальные карточки
   console.log(`\n🃏 Found ${potentialCards.length} potential card elements:`);
   potentialCards.slice(0, 3).forEach((card, index) => {
@@ -2730,8 +3227,9 @@ function diagnosePage() {
   // Проверяем наличие ключевых слов на странице
   const keywords = ['Origin', 'Destination', 'Capacity Type', 'miles', 'Romeoville', 'Dayville'];
   console.log('\n🔤 Keyword search:');
+  const bodyText = document.body.textContent;
   keywords.forEach(keyword => {
-    const count = (document.body.textContent.match(new RegExp(keyword, 'gi')) || []).length;
+    const count = (bodyText.match(new RegExp(keyword, 'gi')) || []).length;
     if (count > 0) {
       console.log(`  ✅ "${keyword}" found ${count} times`);
     }
@@ -2795,6 +3293,14 @@ function isExtensionContextValid() {
   }
 }
 
+// Подробный лог разбора карточек и фильтров. Вызывается для каждой карточки
+// и каждого поля, поэтому пишется только при включенном debugMode в настройках
+function debugLog(...args) {
+  if (monitoringState.settings && monitoringState.settings.debugMode) {
+    console.log(...args);
+  }
+}
+
 // Ограничение частоты логирования
 const logThrottle = new Map();
 
@@ -2841,6 +3347,31 @@ async function safeSendMessage(message, retries = 3) {
   return null;
 }
 
+// Постановка найденного груза в очередь отправки в background script
+function queueLoadFoundMessage(loadData) {
+  loadMessageQueue.pending.push(loadData);
+  drainLoadMessageQueue();
+}
+
+// Отправка грузов из очереди с ограничением числа сообщений в полете
+function drainLoadMessageQueue() {
+  while (loadMessageQueue.inFlight < MAX_INFLIGHT_LOAD_MESSAGES &&
+         loadMessageQueue.pending.length > 0) {
+    const loadData = loadMessageQueue.pending.shift();
+    loadMessageQueue.inFlight++;
+    
+    safeSendMessage({
+      type: 'LOAD_FOUND',
+      data: loadData
+    }).catch(error => {
+      console.error('Error sending load data:', error);
+    }).finally(() => {
+      loadMessageQueue.inFlight--;
+      drainLoadMessageQueue();
+    });
+  }
+}
+
 // Функция автоматического запуска мониторинга
 async function startAutomaticMonitoring() {
   try {
@@ -2900,13 +3431,14 @@ async function startAutomaticMonitoring() {
       }
     }).catch(err => console.warn('Не удалось уведомить background script:', err));
     
-    // Начинаем первое сканирование через небольшую задержку
-    setTimeout(() => {
+    // Первое сканирование — как только на странице появятся карточки
+    // (не дольше 5 секунд), вместо фиксированной паузы
+    waitForSelector(LOAD_ITEMS_QUERY, 5000).then(() => {
       if (monitoringState.isActive) {
         console.log('🎯 Запускаем первое сканирование...');
         performScan();
       }
-    }, 2000);
+    });
     
     console.log('✅ Автоматический мониторинг успешно запущен');
     
@@ -2955,10 +3487,7 @@ function parseLoadFromText(text) {
   }
   
   // 2. Capacity Type - ищем известные типы
-  const capacityTypes = ['Power Only', 'Dry Van', 'Flatbed', 'Reefer', 'Van'];
-  for (const type of capacityTypes) {
-    // Используем регулярное выражение для поиска типа даже если текст слит
-    const typeRegex = new RegExp(type.replace(' ', '\\s*'), 'i');
+  for (const [type, typeRegex] of CAPACITY_TYPE_PATTERNS) {
     if (typeRegex.test(text)) {
       loadData.capacityType = type;
       break;
@@ -212,7 +212,7 @@ window.freightDiag.loads = function() {
     
     try {
       const loadData = parseLoadElement(element);
-      console.log('Парсинг:', loadData);
+      console.log('Парсинг:', loadData || 'недостаточно данных');
     } catch (error) {
       console.log('Ошибка парсинга:', error.message);
     }
@@ -252,6 +252,10 @@ window.freightDiag.test = function() {
   
   try {
     const loadData = parseLoadElement(testElement);
+    if (!loadData) {
+      console.log('❌ Недостаточно данных в карточке');
+      return;
+    }
     console.log('✅ Парсинг успешен:', loadData);
     
     const profitability = calculateProfitability(loadData);
@@ -265,114 +269,5 @@ window.freightDiag.test = function() {
   }
 };
 
-// Функции для поиска элементов (копии из content.js)
-function findLoadElements() {
-  const searchContainers = [
-    '.search-results',
-    '[class*="search-result"]',
-    '[class*="result-container"]',
-    '[class*="load-list"]',
-    '[class*="freight-list"]',
-    'main [class*="container"]',
-    '[role="main"]',
-    '#app main',
-    '.content-area'
-  ];
-  
-  let container = document.body;
-  for (const selector of searchContainers) {
-    const found = document.querySelector(selector);
-    if (found) {
-      container = found;
-      break;
-    }
-  }
-  
-  const loadSelectors = [
-    '[class*="card"][class*="load"]',
-    '[class*="load-card"]',
-    '[class*="freight-card"]',
-    '[class*="search-result-card"]',
-    '[class*="result-item"]',
-    'div[class*="load"][class*="item"]',
-    'article[class*="load"]',
-    '.card',
-    '[data-testid="load-row"]',
-    '.load-item, .freight-item',
-    'tr[class*="load"], tbody tr',
-    '.search-results tr',
-    '[class*="row"][class*="load"]',
-    'table tbody tr'
-  ];
-  
-  for (const selector of loadSelectors) {
-    const elements = container.querySelectorAll(selector);
-    if (elements.length > 0) {
-      return Array.from(elements);
-    }
-  }
-  
-  return [];
-}
-
-function parseLoadElement(element) {
-  const loadData = {
-    id: null,
-    capacityType: null,
-    pickup: null,
-    delivery: null,
-    pickupDate: null,
-    deliveryDate: null,
-    miles: 0,
-    deadhead: 0,
-    rate: 0,
-    originRadius: null,
-    destinationRadius: null,
-    element: element
-  };
-  
-  // Простой парсинг для тестирования
-  const text = element.textContent || '';
-  
-  // Ищем ID
-  const idMatch = text.match(/(?:ID|Reference|Load)\s*[#:]?\s*([A-Z0-9-]+)/i);
-  if (idMatch) loadData.id = idMatch[1];
-  
-  // Ищем города
-  const cityMatch = text.match(/([A-Z][a-z]+(?:ville|ton|burg|city|town)?),\s*([A-Z]{2})/g);
-  if (cityMatch && cityMatch.length >= 2) {
-    loadData.pickup = cityMatch[0];
-    loadData.delivery = cityMatch[1];
-  }
-  
-  // Ищем мили
-  const milesMatch = text.match(/(\d+)\s*mi/i);
-  if (milesMatch) loadData.miles = parseInt(milesMatch[1]);
-  
-  // Ищем ставку
-  const rateMatch = text.match(/\$(\d+(?:,\d+)*(?:\.\d{2})?)/);
-  if (rateMatch) loadData.rate = parseFloat(rateMatch[1].replace(/,/g, ''));
-  
-  return loadData;
-}
-
-function calculateProfitability(load) {
-  const totalMiles = load.miles + load.deadhead;
-  const ratePerMile = totalMiles > 0 ? load.rate / totalMiles : 0;
-  const deadheadRatio = load.miles > 0 ? load.deadhead / load.miles : 1;
-  
-  return {
-    ratePerMile,
-    profitabilityScore: ratePerMile * (1 - deadheadRatio * 0.3),
-    deadheadRatio,
-    isProfitable: ratePerMile >= 2.50 && deadheadRatio <= 0.25,
-    priority: ratePerMile > 3.5 ? 'HIGH' : ratePerMile > 2.5 ? 'MEDIUM' : 'LOW'
-  };
-}
-
-function passesFilters(load, profitability) {
-  return profitability.ratePerMile >= 2.50 && load.deadhead <= 50;
-}
-
 console.log('🔧 FreightPower Load Monitor - Debug utilities loaded');
 console.log('💡 Используйте freightDiag() для диагностики');
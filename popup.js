@@ -90,9 +90,18 @@ async function loadData() {
   try {
     console.log('Loading popup data...');
     
+    // Все три чтения хранилища независимы — запускаем их параллельно,
+    // а ошибки по-прежнему обрабатываем для каждого отдельно
+    const [settingsRead, statsRead, loadsRead] = await Promise.allSettled([
+      chrome.storage.sync.get('settings'),
+      chrome.storage.sync.get('statistics'),
+      chrome.storage.local.get('recentLoads')
+    ]);
+    
     // Загружаем настройки с fallback
     try {
-      const settingsResult = await chrome.storage.sync.get('settings');
+      if (settingsRead.status === 'rejected') throw settingsRead.reason;
+      const settingsResult = settingsRead.value;
       appState.settings = settingsResult.settings || {
         minRatePerMile: 2.5,
         maxDeadhead: 50,
@@ -118,7 +127,8 @@ async function loadData() {
     
     // Загружаем статистику с fallback
     try {
-      const statsResult = await chrome.storage.sync.get('statistics');
+      if (statsRead.status === 'rejected') throw statsRead.reason;
+      const statsResult = statsRead.value;
       appState.statistics = statsResult.statistics || {
         totalScans: 0,
         loadsFound: 0,
@@ -148,7 +158,8 @@ async function loadData() {
     
     // Загружаем последние найденные грузы с fallback
     try {
-      const loadsResult = await chrome.storage.local.get('recentLoads');
+      if (loadsRead.status === 'rejected') throw loadsRead.reason;
+      const loadsResult = loadsRead.value;
       appState.recentLoads = Array.isArray(loadsResult.recentLoads) ? loadsResult.recentLoads : [];
       
       // Валидация и очистка старых записей
@@ -202,13 +213,12 @@ async function loadData() {
       }
     }
     
-    // Если не удалось получить статус от background script, проверяем через вкладки
+    // Проверяем активные вкладки FreightPower для дополнительной информации.
+    // Эта же проверка служит запасным вариантом, если статус от background
+    // script получить не удалось, поэтому отдельно ее не повторяем
     if (!monitoringStatusObtained) {
       console.log('Falling back to tab-based status check');
-      await checkFreightPowerTabs();
     }
-    
-    // Проверяем активные вкладки FreightPower для дополнительной информации
     try {
       await checkFreightPowerTabs();
     } catch (tabError) {
@@ -381,17 +391,16 @@ async function saveQuickSettings() {
         url: 'https://freightpower.schneider.com/*' 
       });
       
-      for (const tab of tabs) {
-        try {
-          await chrome.tabs.sendMessage(tab.id, {
-            type: 'UPDATE_SETTINGS',
-            settings: newSettings
-          });
-        } catch (error) {
+      // Рассылаем настройки во все вкладки параллельно, а не по очереди
+      await Promise.all(tabs.map(tab =>
+        chrome.tabs.sendMessage(tab.id, {
+          type: 'UPDATE_SETTINGS',
+          settings: newSettings
+        }).catch(error => {
           // Игнорируем ошибки отправки сообщений для неактивных вкладок
           console.log(`Could not update settings for tab ${tab.id}:`, error.message);
-        }
-      }
+        })
+      ));
     } catch (error) {
       console.error('Error updating content script settings:', error);
     }